@@ -9,9 +9,15 @@ Usage:
     python scripts/generate_test_label.py --text "Hello"     # Custom text
     python scripts/generate_test_label.py --output my.png    # Custom filename
     python scripts/generate_test_label.py --height 200       # Custom height
+
+Pillow-SIMD (`pip install pillow-simd`) is a drop-in replacement for Pillow and
+speeds up drawing and PNG encoding here without any code changes. Images stay
+in mode "1" throughout so fills and the final save take the fast paths.
 """
 
 import argparse
+import functools
+import io
 from pathlib import Path
 
 try:
@@ -21,11 +27,32 @@ except ImportError:
     exit(1)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load a nice font at the given size, falling back to the default (cached)."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        try:
+            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
+        except OSError:
+            return ImageFont.load_default()
+
+
+def _write_png(img: Image.Image, output_path: Path, compress_level: int) -> None:
+    """Encode to an in-memory buffer and write it with a single call."""
+    # optimize=True would force zlib level 9, so keep it off
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG", compress_level=compress_level, optimize=False)
+    output_path.write_bytes(buffer.getvalue())
+
+
 def create_test_label(
     text: str = "TEST LABEL",
     width: int = 720,
     height: int = 150,
-    output: str = "test_label.png"
+    output: str = "test_label.png",
+    compress_level: int = 1
 ) -> Path:
     """Create a valid test label image."""
 
@@ -33,15 +60,7 @@ def create_test_label(
     img = Image.new("1", (width, height), 1)  # 1-bit, white background
     draw = ImageDraw.Draw(img)
 
-    # Try to use a nice font, fall back to default
-    font_size = 48
-    try:
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except OSError:
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        except OSError:
-            font = ImageFont.load_default()
+    font = _load_font(48)
 
     # Center the text
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -60,9 +79,9 @@ def create_test_label(
     # Add some test elements
     draw.line([(10, height - 20), (width - 10, height - 20)], fill=0, width=1)
 
-    # Save
+    # Save - encode in memory, then write the file in one go
     output_path = Path(output)
-    img.save(output_path, "PNG")
+    _write_png(img, output_path, compress_level)
 
     print(f"Created: {output_path}")
     print(f"  Size: {width}x{height}")
@@ -75,7 +94,8 @@ def create_test_label(
 def create_barcode_label(
     code: str = "1234567890",
     width: int = 720,
-    output: str = "test_barcode.png"
+    output: str = "test_barcode.png",
+    compress_level: int = 1
 ) -> Path:
     """Create a simple barcode-style label (not a real barcode, just for testing)."""
 
@@ -83,24 +103,28 @@ def create_barcode_label(
     img = Image.new("1", (width, height), 1)
     draw = ImageDraw.Draw(img)
 
-    # Fake barcode pattern (just alternating bars for visual testing)
+    # Fake barcode pattern (just alternating bars for visual testing).
+    # Every bar spans the same rows, so build one scanline with slice writes
+    # and stretch it over rows 20-70 in a single paste.
+    scanline = bytearray(b"\xff" * width)
     bar_x = 50
     for i, char in enumerate(code):
         bar_width = (ord(char) % 4) + 2
         if i % 2 == 0:
-            draw.rectangle([bar_x, 20, bar_x + bar_width, 70], fill=0)
+            end = min(bar_x + bar_width + 1, width)
+            if bar_x < end:
+                scanline[bar_x:end] = bytes(end - bar_x)
         bar_x += bar_width + 2
 
-    # Code text below
-    try:
-        font = ImageFont.truetype("arial.ttf", 16)
-    except OSError:
-        font = ImageFont.load_default()
+    bars = Image.frombytes("L", (width, 1), bytes(scanline)).convert("1")
+    img.paste(bars.resize((width, 51), Image.Resampling.NEAREST), (0, 20))
 
+    # Code text below
+    font = _load_font(16)
     draw.text((50, 75), code, fill=0, font=font)
 
     output_path = Path(output)
-    img.save(output_path, "PNG")
+    _write_png(img, output_path, compress_level)
 
     print(f"Created barcode label: {output_path}")
     return output_path
@@ -114,13 +138,17 @@ def main():
     parser.add_argument("--output", "-o", default="test_label.png", help="Output filename")
     parser.add_argument("--barcode", action="store_true", help="Generate barcode-style label")
     parser.add_argument("--code", default="1234567890", help="Barcode value")
+    parser.add_argument(
+        "--compress-level", type=int, default=1, choices=range(10), metavar="0-9",
+        help="PNG zlib level (default: 1, file size rarely matters for test labels)"
+    )
 
     args = parser.parse_args()
 
     if args.barcode:
-        create_barcode_label(args.code, args.width, args.output)
+        create_barcode_label(args.code, args.width, args.output, args.compress_level)
     else:
-        create_test_label(args.text, args.width, args.height, args.output)
+        create_test_label(args.text, args.width, args.height, args.output, args.compress_level)
 
 
 if __name__ == "__main__":
@@ -22,6 +22,8 @@ class QueueManager:
 
     def __init__(self):
         self._queues: dict[str, PrintQueue] = {}
+        # job_id -> printer_id for every job a queue still knows about
+        self._job_index: dict[str, str] = {}
 
     def get_queue(self, printer_id: str) -> Optional[PrintQueue]:
         return self._queues.get(printer_id)
@@ -31,13 +33,35 @@ class QueueManager:
         printer_id: str,
         print_handler: Callable[[PrintJob], Awaitable[PrintResult]]
     ) -> PrintQueue:
-        if printer_id not in self._queues:
-            self._queues[printer_id] = PrintQueue(printer_id, print_handler)
-        return self._queues[printer_id]
+        queue = self._queues.get(printer_id)
+        if queue is None:
+            queue = self._queues[printer_id] = PrintQueue(
+                printer_id,
+                print_handler,
+                on_job_added=self._index_job,
+                on_job_evicted=self._unindex_job
+            )
+        return queue
+
+    def find_job_queue(self, job_id: str) -> Optional[PrintQueue]:
+        """Get the queue holding a job without scanning every queue."""
+        printer_id = self._job_index.get(job_id)
+        return self._queues.get(printer_id) if printer_id else None
+
+    def _index_job(self, printer_id: str, job_id: str) -> None:
+        self._job_index[job_id] = printer_id
+
+    def _unindex_job(self, printer_id: str, job_id: str) -> None:
+        self._job_index.pop(job_id, None)
 
     def get_all_queues(self) -> dict[str, PrintQueue]:
         return self._queues
 
+    async def close(self) -> None:
+        """Stop every queue's background tasks."""
+        for queue in self._queues.values():
+            await queue.close()
+
 
 def init_dependencies(
     registry: PrinterRegistry,
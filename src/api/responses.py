@@ -0,0 +1,26 @@
+"""
+JSON response class for API routes.
+
+Uses orjson when installed (pip install orjson) to encode the status/queue
+dicts returned on every request in native code. Falls back to the stdlib
+encoder otherwise, with identical output for the types the API returns.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson when it is available."""
+
+    def render(self, content: Any) -> bytes:
+        if not ORJSON_AVAILABLE:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -4,20 +4,93 @@ API routes for print gateway.
 Base URL: /v1
 """
 
-from datetime import datetime
-from typing import Optional
+import asyncio
+import time
+from typing import Callable, Optional, TypeVar
 
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
-from fastapi.responses import JSONResponse
 
 from src.api.dependencies import get_printer_registry, get_queue_manager, get_router
-from src.printers.base import PrinterStatus, PrintJob
-from src.validation import validate_label_image, validate_pdf
+from src.api.responses import FastJSONResponse
+from src.printers.base import ONLINE_STATUSES, PrinterStatus, PrintJob
+from src.validation import ValidationCache, validate_label_image, validate_pdf
+from src.validation.document import PDF_SIGNATURE
+from src.validation.image import PNG_SIGNATURE
 
 router = APIRouter(prefix="/v1")
 
-# Track server start time
-_server_start_time = datetime.now()
+T = TypeVar("T")
+
+# Track server start time (monotonic, so uptime is immune to clock changes)
+_server_start_monotonic = time.monotonic()
+
+# Uploads are read in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Per-endpoint upload limits
+MAX_LABEL_UPLOAD_BYTES = 8 * 1024 * 1024
+MAX_DOCUMENT_UPLOAD_BYTES = 64 * 1024 * 1024
+
+# Retried uploads of the same file reuse the earlier validation result
+_validation_cache = ValidationCache()
+
+
+async def _read_upload(
+    file: UploadFile,
+    max_bytes: int,
+    signature: Optional[bytes] = None
+) -> bytes:
+    """
+    Read an uploaded file in fixed-size chunks.
+
+    UploadFile moves each read to the threadpool once the upload has spooled
+    to disk, so large files never hold the event loop for one long copy.
+    The chunks are joined once at the end. Raises 413 past max_bytes.
+
+    If signature is given and the first chunk doesn't start with it, reading
+    stops there and only that chunk is returned - the caller's validation
+    rejects it without the rest of the file ever being copied into memory.
+    """
+    chunks = []
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        if signature is not None and not chunks and not chunk.startswith(signature):
+            return chunk
+        total += len(chunk)
+        if total > max_bytes:
+            raise _upload_too_large(max_bytes)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _validate(validator: Callable[[bytes], T], data: bytes) -> T:
+    """
+    Run an upload validator in the default executor. Decoding a tall label
+    or parsing a large PDF would otherwise stall every other request on
+    the event loop, and Pillow releases the GIL for much of its work, so
+    concurrent uploads validate in parallel.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _validation_cache.validate, validator, data)
+
+
+def _upload_too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File too large (max {max_bytes} bytes)")
+
+
+def _not_png_response() -> FastJSONResponse:
+    """
+    Reject an upload whose first bytes aren't a PNG signature.
+
+    Checked before validate_label_image so mislabeled uploads never reach PIL.
+    """
+    return FastJSONResponse(
+        status_code=400,
+        content={
+            "error": "File does not appear to be a PNG",
+            "code": "INVALID_FORMAT"
+        }
+    )
 
 
 @router.get("/health")
@@ -39,7 +112,7 @@ async def health_check(detailed: bool = Query(default=False)):
     statuses = await registry.get_all_status()
 
     printers_ok = all(
-        status in (PrinterStatus.READY, PrinterStatus.BUSY)
+        status in ONLINE_STATUSES
         for status in statuses.values()
     )
 
@@ -48,7 +121,7 @@ async def health_check(detailed: bool = Query(default=False)):
         for q in queue_manager.get_all_queues().values()
     )
 
-    uptime_seconds = (datetime.now() - _server_start_time).total_seconds()
+    uptime_seconds = time.monotonic() - _server_start_monotonic
 
     return {
         "status": "ok" if printers_ok else "degraded",
@@ -56,7 +129,7 @@ async def health_check(detailed: bool = Query(default=False)):
         "printers": {
             pid: {
                 "status": status.value,
-                "online": status in (PrinterStatus.READY, PrinterStatus.BUSY)
+                "online": status in ONLINE_STATUSES
             }
             for pid, status in statuses.items()
         },
@@ -83,7 +156,7 @@ async def get_status():
         printer_info = {
             "name": printer.name,
             "status": status.value,
-            "online": status in (PrinterStatus.READY, PrinterStatus.BUSY),
+            "online": status in ONLINE_STATUSES,
         }
 
         # Add device state if available (BrotherQLAdapter has this)
@@ -107,21 +180,27 @@ async def get_status():
 
 @router.get("/queue")
 async def get_queue(printer_id: Optional[str] = None):
-    """Get queue status for all or specific printer."""
+    """
+    Get queue status for all or specific printer.
+
+    The job dicts hold only plain JSON types, so they're returned as a
+    FastJSONResponse directly rather than walked by FastAPI's
+    jsonable_encoder first.
+    """
     queue_manager = get_queue_manager()
 
     if printer_id:
         queue = queue_manager.get_queue(printer_id)
         if not queue:
             raise HTTPException(status_code=404, detail=f"Printer not found: {printer_id}")
-        return {
+        return FastJSONResponse({
             "printer_id": printer_id,
             "queue": queue.get_queue(),
             "status": queue.get_status()
-        }
+        })
 
     # Return all queues
-    return {
+    return FastJSONResponse({
         "queues": {
             pid: {
                 "queue": q.get_queue(),
@@ -129,7 +208,7 @@ async def get_queue(printer_id: Optional[str] = None):
             }
             for pid, q in queue_manager.get_all_queues().items()
         }
-    }
+    })
 
 
 @router.post("/print/label")
@@ -156,12 +235,12 @@ async def print_label(
         raise HTTPException(status_code=404, detail=f"Printer not found: {printer_id}")
 
     # Check printer status
-    status = await printer.get_status()
+    status = await printer.get_cached_status()
     if status == PrinterStatus.ERROR:
         raise HTTPException(status_code=503, detail="Printer error")
 
     # Read and validate image
-    data = await file.read()
+    data = await _read_upload(file, MAX_LABEL_UPLOAD_BYTES, PNG_SIGNATURE)
 
     if not data:
         raise HTTPException(status_code=400, detail="Empty file")
@@ -174,10 +253,14 @@ async def print_label(
             detail=f"Invalid content type: {content_type}. Expected: image/png"
         )
 
+    # Cheap signature check before decoding
+    if not data.startswith(PNG_SIGNATURE):
+        return _not_png_response()
+
     # Validate image requirements
-    validation = validate_label_image(data)
+    validation = await _validate(validate_label_image, data)
     if not validation.valid:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": validation.error,
@@ -214,14 +297,14 @@ async def print_label(
         if resilience and resilience.offline_queue_enabled:
             try:
                 queued = await queue.add_offline(job)
-                return JSONResponse(
+                return FastJSONResponse(
                     status_code=202,  # Accepted, not immediately processed
                     content={
                         "job_id": job.id,
                         "status": queued.status.value,
                         "message": "Printer offline - job queued",
                         "queue_position": len(queue.get_queue()),
-                        "expires_at": queued.expires_at.isoformat() if queued.expires_at else None,
+                        "expires_at": queued.expires_at_iso,
                     }
                 )
             except Exception as e:
@@ -264,22 +347,22 @@ async def print_document(
         raise HTTPException(status_code=404, detail=f"Printer not found: {printer_id}")
 
     # Check printer is online
-    status = await printer.get_status()
+    status = await printer.get_cached_status()
     if status == PrinterStatus.OFFLINE:
         raise HTTPException(status_code=503, detail="Printer offline")
     if status == PrinterStatus.ERROR:
         raise HTTPException(status_code=503, detail="Printer error")
 
     # Read file
-    data = await file.read()
+    data = await _read_upload(file, MAX_DOCUMENT_UPLOAD_BYTES, PDF_SIGNATURE)
 
     if not data:
         raise HTTPException(status_code=400, detail="Empty file")
 
     # Validate PDF
-    validation = validate_pdf(data)
+    validation = await _validate(validate_pdf, data)
     if not validation.valid:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": validation.error,
@@ -322,23 +405,10 @@ async def get_job(job_id: str):
     """Get status of a specific print job."""
     queue_manager = get_queue_manager()
 
-    for queue in queue_manager.get_all_queues().values():
-        job = queue.get_job(job_id)
-        if job:
-            result = {
-                "id": job.job.id,
-                "printer_id": job.job.printer_id,
-                "filename": job.job.filename,
-                "status": job.status.value,
-                "queued_at": job.queued_at.isoformat(),
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "error": job.error
-            }
-            # Include expiration for offline jobs
-            if job.expires_at:
-                result["expires_at"] = job.expires_at.isoformat()
-            return result
+    queue = queue_manager.find_job_queue(job_id)
+    job = queue.get_job(job_id) if queue else None
+    if job:
+        return job.to_dict()
 
     raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
@@ -348,9 +418,9 @@ async def cancel_job(job_id: str):
     """Cancel a queued print job."""
     queue_manager = get_queue_manager()
 
-    for queue in queue_manager.get_all_queues().values():
-        if await queue.cancel(job_id):
-            return {"message": "Job cancelled", "job_id": job_id}
+    queue = queue_manager.find_job_queue(job_id)
+    if queue and await queue.cancel(job_id):
+        return {"message": "Job cancelled", "job_id": job_id}
 
     raise HTTPException(status_code=404, detail=f"Job not found or already processing: {job_id}")
 
@@ -396,19 +466,22 @@ async def print_with_intent(
     queue_manager = get_queue_manager()
     print_router = get_router()
 
-    # Read file first to determine content type
-    data = await file.read()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty file")
-
     # Determine content type
     content_type = file.content_type or "application/octet-stream"
     is_image = content_type.startswith("image/") or content_type == "application/octet-stream"
     is_pdf = content_type == "application/pdf" or (file.filename and file.filename.lower().endswith(".pdf"))
 
+    # Read file, stopping early if it can't be the type it claims to be
+    signature = PNG_SIGNATURE if is_image else PDF_SIGNATURE if is_pdf else None
+    data = await _read_upload(file, MAX_DOCUMENT_UPLOAD_BYTES, signature)
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty file")
+
     # Resolve intent to printer
     if is_image:
         detected_type = "image/png"
+        if len(data) > MAX_LABEL_UPLOAD_BYTES:
+            raise _upload_too_large(MAX_LABEL_UPLOAD_BYTES)
     elif is_pdf:
         detected_type = "application/pdf"
     else:
@@ -417,11 +490,11 @@ async def print_with_intent(
     printer_id = print_router.resolve(intent)
     if not printer_id:
         # Check if intent exists at all
-        available = list(print_router.list_intents().keys())
-        if available:
+        intents = print_router.list_intents()
+        if intents:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unknown intent: '{intent}'. Available: {available}"
+                detail=f"Unknown intent: '{intent}'. Available: {list(intents)}"
             )
         else:
             # No intents configured, fall back to defaults
@@ -436,7 +509,7 @@ async def print_with_intent(
         )
 
     # Check printer status
-    status = await printer.get_status()
+    status = await printer.get_cached_status()
     if status == PrinterStatus.OFFLINE:
         raise HTTPException(status_code=503, detail=f"Printer '{printer_id}' is offline")
     if status == PrinterStatus.ERROR:
@@ -444,9 +517,11 @@ async def print_with_intent(
 
     # Validate based on content type
     if is_image or detected_type == "image/png":
-        validation = validate_label_image(data)
+        if not data.startswith(PNG_SIGNATURE):
+            return _not_png_response()
+        validation = await _validate(validate_label_image, data)
         if not validation.valid:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=400,
                 content={
                     "error": validation.error,
@@ -460,9 +535,9 @@ async def print_with_intent(
             )
         final_content_type = "image/png"
     elif is_pdf or detected_type == "application/pdf":
-        validation = validate_pdf(data)
+        validation = await _validate(validate_pdf, data)
         if not validation.valid:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=400,
                 content={
                     "error": validation.error,
@@ -9,10 +9,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.dependencies import QueueManager, init_dependencies
-from src.api.routes import router
+from src.api.middleware import MaxUploadSizeMiddleware
+from src.api.responses import FastJSONResponse
+from src.api.routes import MAX_DOCUMENT_UPLOAD_BYTES, router
 from src.health import HealthMonitor
 from src.printers import PrinterRegistry
-from src.printers.base import PrinterStatus
+from src.printers.base import ONLINE_STATUSES, PrinterStatus
 from src.routing import PrintRouter
 
 logger = logging.getLogger(__name__)
@@ -23,7 +25,8 @@ def create_app(
     routing_config: dict = None,
     cors_origins: list[str] = None,
     debug: bool = False,
-    health_check_interval_sec: float = 30.0
+    health_check_interval_sec: float = 30.0,
+    max_upload_bytes: int = MAX_DOCUMENT_UPLOAD_BYTES
 ) -> FastAPI:
     """
     Create and configure FastAPI application.
@@ -34,6 +37,7 @@ def create_app(
         cors_origins: List of allowed CORS origins (None = allow all)
         debug: Enable debug mode
         health_check_interval_sec: How often to check printer health (default 30s)
+        max_upload_bytes: Largest request body accepted before returning 413
 
     Returns:
         Configured FastAPI app
@@ -42,9 +46,14 @@ def create_app(
         title="Print Gateway Server",
         description="REST API for centralized print management",
         version="1.0.0",
-        debug=debug
+        debug=debug,
+        default_response_class=FastJSONResponse
     )
 
+    # Refuse oversized uploads before their body is buffered.
+    # Added before CORS so CORS stays outermost and 413s keep their headers.
+    app.add_middleware(MaxUploadSizeMiddleware, max_body_bytes=max_upload_bytes)
+
     # CORS configuration
     if cors_origins is None:
         # Development: allow all origins
@@ -76,7 +85,7 @@ def create_app(
         """Handle printer status changes from health monitor."""
         # When printer comes back online, notify its queue to process offline jobs
         if (old_status == PrinterStatus.OFFLINE and
-                new_status in (PrinterStatus.READY, PrinterStatus.BUSY)):
+                new_status in ONLINE_STATUSES):
             queue = queue_manager.get_queue(printer_id)
             if queue:
                 logger.info(f"Printer {printer_id} back online, processing offline queue")
@@ -114,12 +123,12 @@ def create_app(
 
         # Start health monitor
         await health_monitor.start()
-        logger.info(f"Health monitor started (interval: {health_check_interval_sec}s)")
 
     @app.on_event("shutdown")
     async def shutdown():
         logger.info("Print Gateway Server shutting down...")
         # Stop health monitor
         await health_monitor.stop()
+        await queue_manager.close()
 
     return app
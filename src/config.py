@@ -2,59 +2,99 @@
 Configuration loading and printer setup.
 """
 
+import copy
+import functools
+import importlib
+import json
 import logging
 import os
-from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import yaml
 
-from src.printers import PrinterRegistry
-from src.printers.brother_ql_adapter import BrotherQLAdapter
-from src.printers.cups_adapter import CUPSAdapter
-from src.printers.mock import MockDocumentPrinter, MockLabelPrinter
+# Use the LibYAML-backed loader when PyYAML was built with it. Configs are
+# read into one string first so LibYAML parses a single buffer.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+from src.printers import PrinterBase, PrinterRegistry
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class ResilienceConfig:
-    """USB resilience configuration for printers."""
-
-    auto_reconnect: bool = True
-    max_retries: int = 3
-    retry_delay_ms: int = 1000
-    health_check_interval_sec: float = 30.0
-    offline_queue_enabled: bool = True
-    offline_queue_timeout_sec: float = 600.0  # 10 minutes
-
-    @classmethod
-    def from_dict(cls, config: dict) -> "ResilienceConfig":
-        """Create ResilienceConfig from a dictionary (YAML config section)."""
-        resilience = config.get("resilience", {})
-        return cls(
-            auto_reconnect=resilience.get("auto_reconnect", True),
-            max_retries=resilience.get("max_retries", 3),
-            retry_delay_ms=resilience.get("retry_delay_ms", 1000),
-            health_check_interval_sec=resilience.get("health_check_interval_sec", 30.0),
-            offline_queue_enabled=resilience.get("offline_queue_enabled", True),
-            offline_queue_timeout_sec=resilience.get("offline_queue_timeout_sec", 600.0),
-        )
-
-    @property
-    def retry_delay_sec(self) -> float:
-        """Get retry delay in seconds."""
-        return self.retry_delay_ms / 1000.0
-
-
-# Map adapter types to classes
-ADAPTER_TYPES = {
-    "mock_label": MockLabelPrinter,
-    "mock_document": MockDocumentPrinter,
-    "brother_ql": BrotherQLAdapter,
-    "cups": CUPSAdapter,
-}
+# Default config locations, relative to the project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG_PATHS = (
+    PROJECT_ROOT / "config" / "local.yaml",
+    PROJECT_ROOT / "config" / "default.yaml",
+)
+
+# Map adapter types to "module:Class" (read-only). Adapter modules are only
+# imported once a configured printer uses them, so deployments don't pay
+# for brother_ql/pycups imports they never need.
+ADAPTER_TYPES = MappingProxyType({
+    "mock_label": "src.printers.mock:MockLabelPrinter",
+    "mock_document": "src.printers.mock:MockDocumentPrinter",
+    "brother_ql": "src.printers.brother_ql_adapter:BrotherQLAdapter",
+    "cups": "src.printers.cups_adapter:CUPSAdapter",
+})
+
+
+@functools.cache
+def _load_adapter_class(target: str) -> type[PrinterBase]:
+    """Import and return the adapter class for a "module:Class" target."""
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _parse_config_file(path: Path) -> dict:
+    """
+    Parse a YAML config file.
+
+    With CONFIG_CACHE=1 the parsed result is also written to a
+    <path>.cache.json sidecar and reused while it's newer than the YAML,
+    since JSON loads much faster. Configs JSON can't reproduce exactly
+    (e.g. non-string keys) are never cached. Off by default so edits during
+    development are always picked up without thinking about the cache.
+    """
+    if os.environ.get("CONFIG_CACHE") != "1":
+        return yaml.load(path.read_text(), Loader=_SafeLoader)
+
+    cache = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        if cache.stat().st_mtime >= path.stat().st_mtime:
+            return json.loads(cache.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, parse the YAML instead
+
+    config = yaml.load(path.read_text(), Loader=_SafeLoader)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        encoded = json.dumps(config)
+        # JSON turns non-string keys into strings (YAML "1: foo" would come
+        # back as "1"), so only cache configs that survive the round trip
+        if json.loads(encoded) != config:
+            cache.unlink(missing_ok=True)
+            logger.debug(f"Not caching parsed config for {path}: it doesn't round-trip through JSON")
+            return config
+        # Write then rename, so a reader never sees a half-written cache
+        tmp.write_text(encoded)
+        os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError) as e:
+        # Best effort: read-only config dirs or values JSON can't represent
+        tmp.unlink(missing_ok=True)
+        logger.debug(f"Not caching parsed config for {path}: {e}")
+    return config
+
+
+@functools.lru_cache(maxsize=8)
+def _load_parsed(path_str: str, mtime_ns: int) -> dict:
+    """Parse a config file once per (path, mtime); callers get a deep copy."""
+    return _parse_config_file(Path(path_str))
 
 
 def load_config(config_path: Optional[str] = None) -> dict:
@@ -66,6 +106,11 @@ def load_config(config_path: Optional[str] = None) -> dict:
     2. CONFIG_FILE environment variable
     3. ./config/local.yaml
     4. ./config/default.yaml
+
+    Set CONFIG_CACHE=1 to cache the parsed config next to the file.
+
+    Repeated calls for an unchanged file reuse the parsed result. The
+    returned dict is always a fresh copy, so callers may modify it.
     """
     search_paths = []
 
@@ -75,18 +120,15 @@ def load_config(config_path: Optional[str] = None) -> dict:
     if env_path := os.environ.get("CONFIG_FILE"):
         search_paths.append(Path(env_path))
 
-    # Default paths relative to project root
-    project_root = Path(__file__).parent.parent
-    search_paths.extend([
-        project_root / "config" / "local.yaml",
-        project_root / "config" / "default.yaml",
-    ])
+    search_paths.extend(_DEFAULT_CONFIG_PATHS)
 
     for path in search_paths:
-        if path.exists():
-            logger.info(f"Loading config from {path}")
-            with open(path) as f:
-                return yaml.safe_load(f)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        logger.info(f"Loading config from {path}")
+        return copy.deepcopy(_load_parsed(str(path.resolve()), mtime_ns))
 
     logger.warning("No config file found, using defaults")
     return {}
@@ -119,8 +161,10 @@ def setup_printers(config: dict) -> PrinterRegistry:
     if not printer_configs:
         # Default to mock printers for development
         logger.info("No printers configured, using mock printers")
-        registry.register(MockLabelPrinter("label", "Mock Label Printer"))
-        registry.register(MockDocumentPrinter("document", "Mock Document Printer"))
+        label_class = _load_adapter_class(ADAPTER_TYPES["mock_label"])
+        document_class = _load_adapter_class(ADAPTER_TYPES["mock_document"])
+        registry.register(label_class("label", "Mock Label Printer"))
+        registry.register(document_class("document", "Mock Document Printer"))
         return registry
 
     for printer_conf in printer_configs:
@@ -137,12 +181,13 @@ def setup_printers(config: dict) -> PrinterRegistry:
             logger.warning("Printer config missing 'id', skipping")
             continue
 
-        if adapter_type not in ADAPTER_TYPES:
+        adapter_target = ADAPTER_TYPES.get(adapter_type)
+        if adapter_target is None:
             logger.warning(f"Unknown adapter type '{adapter_type}' for {printer_id}, skipping")
             continue
 
-        adapter_class = ADAPTER_TYPES[adapter_type]
         try:
+            adapter_class = _load_adapter_class(adapter_target)
             printer = adapter_class(printer_id, name, adapter_config)
             registry.register(printer)
             logger.info(f"Registered printer: {name} ({printer_id}) using {adapter_type}")
@@ -10,7 +10,7 @@ import logging
 from typing import Awaitable, Callable, Optional
 
 from src.printers import PrinterRegistry
-from src.printers.base import PrinterBase, PrinterStatus
+from src.printers.base import ONLINE_STATUSES, PrinterBase, PrinterStatus
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,13 @@ StatusChangeCallback = Callable[
     Awaitable[None]
 ]
 
+# Connection events keyed by (old_status, new_status). Going offline from
+# any state is a disconnect; only offline -> ready/busy is a reconnect.
+_TRANSITION_EVENTS: dict[tuple[Optional[PrinterStatus], PrinterStatus], str] = {
+    **{(old, PrinterStatus.OFFLINE): "USB_DISCONNECTED" for old in (None, *PrinterStatus)},
+    **{(PrinterStatus.OFFLINE, new): "USB_RECONNECTED" for new in ONLINE_STATUSES},
+}
+
 
 class HealthMonitor:
     """
@@ -30,14 +37,18 @@ class HealthMonitor:
     - Periodic status polling for all registered printers
     - Detects status transitions (online → offline, offline → online)
     - Fires callback on status changes to enable queue processing
-    - Configurable check interval
+    - Adaptive per-printer check interval: a printer whose status just
+      changed is re-checked after min_interval_sec, and the interval
+      doubles while its status stays the same, up to max_interval_sec
     """
 
     def __init__(
         self,
         registry: PrinterRegistry,
         on_status_change: Optional[StatusChangeCallback] = None,
-        default_interval_sec: float = 30.0
+        default_interval_sec: float = 30.0,
+        min_interval_sec: float = 1.0,
+        max_interval_sec: Optional[float] = None
     ):
         """
         Initialize the health monitor.
@@ -47,15 +58,31 @@ class HealthMonitor:
             on_status_change: Async callback called when printer status changes.
                               Signature: (printer_id, old_status, new_status) -> None
             default_interval_sec: How often to check printer status (default 30s)
+            min_interval_sec: Re-check delay right after a status change (default 1s)
+            max_interval_sec: Longest delay for a stable printer
+                              (default: default_interval_sec)
         """
         self.registry = registry
         self.on_status_change = on_status_change
         self.default_interval_sec = default_interval_sec
+        self.max_interval_sec = (
+            max_interval_sec if max_interval_sec is not None else default_interval_sec
+        )
+        self.min_interval_sec = min(min_interval_sec, self.max_interval_sec)
 
         self._task: Optional[asyncio.Task] = None
         self._running = False
+        self._stop_event = asyncio.Event()
         self._last_status: dict[str, PrinterStatus] = {}
 
+        # Printers to poll, rebuilt only when the registry changes
+        self._printers_snapshot: tuple[PrinterBase, ...] = ()
+        self._snapshot_version = -1
+
+        # Per-printer polling schedule, in loop.time() seconds
+        self._interval: dict[str, float] = {}
+        self._next_check_at: dict[str, float] = {}
+
     async def start(self) -> None:
         """Start the health monitor background task."""
         if self._running:
@@ -63,15 +90,18 @@ class HealthMonitor:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._monitor_loop())
         logger.info(
-            f"Health monitor started (interval: {self.default_interval_sec}s)"
+            "Health monitor started (interval: %ss)", self.default_interval_sec
         )
 
     async def stop(self) -> None:
         """Stop the health monitor."""
         self._running = False
+        self._stop_event.set()
         if self._task:
+            # Also interrupts a probe that is still in flight
             self._task.cancel()
             try:
                 await self._task
@@ -98,39 +128,93 @@ class HealthMonitor:
         return await self._check_all_printers()
 
     async def _monitor_loop(self) -> None:
-        """Main monitoring loop."""
+        """
+        Main monitoring loop.
+
+        Sleeps until the earliest per-printer deadline and probes only the
+        printers that are due. Deadlines are measured from loop.time() at
+        the start of each check, so slow probes don't make the schedule
+        drift.
+        """
+        loop = asyncio.get_running_loop()
+
         # Do initial check immediately
         try:
             await self._check_all_printers()
         except Exception as e:
-            logger.error(f"Initial health check failed: {e}")
+            logger.error("Initial health check failed: %s", e)
 
         while self._running:
             try:
-                await asyncio.sleep(self.default_interval_sec)
-                if self._running:  # Check again after sleep
-                    await self._check_all_printers()
+                now = loop.time()
+                next_check_at = min(
+                    self._next_check_at.values(), default=now + self.max_interval_sec
+                )
+                try:
+                    async with asyncio.timeout_at(next_check_at):
+                        await self._stop_event.wait()
+                except TimeoutError:
+                    # Slept until the next deadline without stop() being called
+                    await self._check_all_printers(due_only=True)
+                else:
+                    break  # stop() was called
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Health check error: {e}")
+                logger.error("Health check error: %s", e)
 
-    async def _check_all_printers(self) -> dict[str, PrinterStatus]:
+    async def _check_all_printers(self, due_only: bool = False) -> dict[str, PrinterStatus]:
         """
-        Check status of all printers and detect changes.
+        Check status of printers and detect changes.
 
-        Returns dict of current statuses.
+        Checks every printer, or with due_only just those whose next check
+        is due. Returns dict of current statuses for the printers checked.
         """
         current_statuses: dict[str, PrinterStatus] = {}
 
-        for printer in self.registry.list_all():
+        if self.registry.version != self._snapshot_version:
+            self._printers_snapshot = tuple(self.registry.list_all())
+            self._snapshot_version = self.registry.version
+            # Forget the schedule of printers no longer registered, or their
+            # stale deadlines would keep waking the monitor loop
+            current_ids = {printer.printer_id for printer in self._printers_snapshot}
+            for schedule in (self._interval, self._next_check_at):
+                for printer_id in schedule.keys() - current_ids:
+                    del schedule[printer_id]
+
+        now = asyncio.get_running_loop().time()
+        printers = self._printers_snapshot
+        if due_only:
+            printers = tuple(
+                printer for printer in printers
+                if self._next_check_at.get(printer.printer_id, now) <= now
+            )
+
+        # Probe concurrently; handle the results in order
+        results = await asyncio.gather(
+            *(printer.get_status() for printer in printers),
+            return_exceptions=True
+        )
+
+        for printer, result in zip(printers, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # Don't swallow cancellation
+                logger.error("Failed to check status for %s: %s", printer.printer_id, result)
+                # Don't update last_status on error - preserve previous state
+                self._schedule(printer.printer_id, now, changed=False)
+                continue
+
+            changed = False
             try:
-                current_status = await printer.get_status()
+                current_status = printer.cache_status(result)
                 current_statuses[printer.printer_id] = current_status
 
                 previous_status = self._last_status.get(printer.printer_id)
 
                 if previous_status != current_status:
+                    # The first status seen isn't a transition worth chasing
+                    changed = previous_status is not None
                     await self._handle_status_change(
                         printer, previous_status, current_status
                     )
@@ -138,11 +222,23 @@ class HealthMonitor:
                 self._last_status[printer.printer_id] = current_status
 
             except Exception as e:
-                logger.error(f"Failed to check status for {printer.printer_id}: {e}")
-                # Don't update last_status on error - preserve previous state
+                logger.error("Failed to check status for %s: %s", printer.printer_id, e)
+
+            self._schedule(printer.printer_id, now, changed)
 
         return current_statuses
 
+    def _schedule(self, printer_id: str, checked_at: float, changed: bool) -> None:
+        """Set a printer's next check: soon after a change, backing off while stable."""
+        if changed:
+            interval = self.min_interval_sec
+        elif printer_id in self._interval:
+            interval = min(self._interval[printer_id] * 2, self.max_interval_sec)
+        else:
+            interval = self.max_interval_sec
+        self._interval[printer_id] = interval
+        self._next_check_at[printer_id] = checked_at + interval
+
     async def _handle_status_change(
         self,
         printer: PrinterBase,
@@ -154,27 +250,26 @@ class HealthMonitor:
 
         if old_status is None:
             logger.info(
-                f"[HEALTH] Printer {printer_id}: initial status = {new_status.value}"
+                "[HEALTH] Printer %s: initial status = %s", printer_id, new_status.value
             )
         else:
             logger.info(
-                f"[HEALTH] Printer {printer_id}: {old_status.value} -> {new_status.value}"
+                "[HEALTH] Printer %s: %s -> %s",
+                printer_id, old_status.value, new_status.value
             )
 
         # Emit specific events based on transition
-        if new_status == PrinterStatus.OFFLINE:
-            self._emit_event("USB_DISCONNECTED", printer_id)
-        elif (old_status == PrinterStatus.OFFLINE and
-              new_status in (PrinterStatus.READY, PrinterStatus.BUSY)):
-            self._emit_event("USB_RECONNECTED", printer_id)
+        event_type = _TRANSITION_EVENTS.get((old_status, new_status))
+        if event_type:
+            self._emit_event(event_type, printer_id)
 
         # Fire callback for external handling (e.g., queue processing)
         if self.on_status_change:
             try:
                 await self.on_status_change(printer_id, old_status, new_status)
             except Exception as e:
-                logger.error(f"Status change callback failed: {e}")
+                logger.error("Status change callback failed: %s", e)
 
     def _emit_event(self, event_type: str, printer_id: str) -> None:
         """Log a connection event."""
-        logger.info(f"[EVENT] {event_type}: printer={printer_id}")
+        logger.info("[EVENT] %s: printer=%s", event_type, printer_id)
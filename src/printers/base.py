@@ -1,3 +1,4 @@
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -5,6 +6,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+# How long get_cached_status() reuses a probed status
+STATUS_CACHE_TTL_SEC = 0.25
+
 
 class PrinterStatus(Enum):
     READY = "ready"
@@ -13,19 +17,31 @@ class PrinterStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Statuses that count as "online". A tuple: Enum members compare by
+# identity, so membership is a pointer check with no hashing.
+ONLINE_STATUSES = (PrinterStatus.READY, PrinterStatus.BUSY)
+
+
+@dataclass(slots=True)
 class PrintJob:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Random, not a counter: anyone holding a job ID can cancel the job
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     printer_id: str = ""
     filename: str = ""
     data: bytes = b""
     content_type: str = ""
-    created_at: datetime = field(default_factory=datetime.now)
+    # Wall-clock nanoseconds; cheaper to stamp per job than a datetime
+    created_at_ns: int = field(default_factory=time.time_ns)
     copies: int = 1
     options: dict = field(default_factory=dict)
 
+    @property
+    def created_at(self) -> datetime:
+        """Local creation time, built on demand."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
 
-@dataclass
+@dataclass(slots=True)
 class PrintResult:
     success: bool
     job_id: str
@@ -41,11 +57,37 @@ class PrinterBase(ABC):
         self.name = name
         self.config = config
 
+        self._cached_status: Optional[PrinterStatus] = None
+        self._cached_status_expires = 0.0
+
+        # Built on first to_dict() call; id, name and types don't change
+        self._info_cache: Optional[dict] = None
+
     @abstractmethod
     async def get_status(self) -> PrinterStatus:
         """Check if printer is ready."""
         pass
 
+    async def get_cached_status(self) -> PrinterStatus:
+        """
+        Get printer status, reusing a probe from the last STATUS_CACHE_TTL_SEC.
+
+        Lets a burst of print requests share one device probe.
+        """
+        if self._cached_status is not None and time.monotonic() < self._cached_status_expires:
+            return self._cached_status
+        return self.cache_status(await self.get_status())
+
+    def cache_status(self, status: PrinterStatus) -> PrinterStatus:
+        """Record a freshly probed status for get_cached_status()."""
+        self._cached_status = status
+        self._cached_status_expires = time.monotonic() + STATUS_CACHE_TTL_SEC
+        return status
+
+    def invalidate_status_cache(self) -> None:
+        """Force the next get_cached_status() to probe the device."""
+        self._cached_status = None
+
     @abstractmethod
     async def print(self, job: PrintJob) -> PrintResult:
         """Send a print job to the printer."""
@@ -63,9 +105,11 @@ class PrinterBase(ABC):
         pass
 
     def to_dict(self) -> dict:
-        """Return printer info as dict for API responses."""
-        return {
-            "id": self.printer_id,
-            "name": self.name,
-            "supported_types": self.supported_content_types,
-        }
+        """Return printer info as dict for API responses (cached, don't mutate)."""
+        if self._info_cache is None:
+            self._info_cache = {
+                "id": self.printer_id,
+                "name": self.name,
+                "supported_types": self.supported_content_types,
+            }
+        return self._info_cache
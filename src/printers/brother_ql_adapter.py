@@ -7,13 +7,20 @@ Connection: USB (typically usb://0x04f9:0x2044 format)
 
 Resilience features:
 - Automatic USB reconnection on I/O errors
-- Retry logic with configurable attempts and backoff
-- Actual device status probing (not cached)
+- Retry logic with configurable attempts and jittered exponential backoff
+- Actual device status probing (USB enumeration shared for a couple of seconds)
 - Event logging for connection state changes
 """
 
 import asyncio
+import functools
 import logging
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
@@ -42,6 +49,139 @@ except ImportError:
     BROTHER_QL_AVAILABLE = False
     logger.warning("brother_ql package not available - BrotherQLAdapter will not function")
 
+# The pyusb backend lets a worker thread keep the device open between jobs;
+# without it every job goes through send(), which opens the device each time
+try:
+    from brother_ql.backends.pyusb import BrotherQLBackendPyUSB
+    from brother_ql.reader import interpret_response
+    PERSISTENT_USB_AVAILABLE = True
+except ImportError:
+    PERSISTENT_USB_AVAILABLE = False
+
+
+# PNG decode and raster conversion get their own pool, so CPU-bound work
+# never queues behind (or in front of) blocking I/O in the default executor
+_cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="brotherql-cpu")
+
+
+# USB enumeration is slow, so discover() results are shared briefly by every
+# adapter instance (status probes for several printers, reconnect attempts)
+DISCOVER_CACHE_TTL_SEC = 2.0
+_discover_cache: dict[str, tuple[float, list]] = {}
+_discover_lock: Optional[asyncio.Lock] = None  # Created on first use, inside the running loop
+
+
+async def _cached_discover(backend: str = "pyusb", ttl: float = DISCOVER_CACHE_TTL_SEC) -> list:
+    """Run brother_ql discover() in the executor at most once per ttl."""
+    global _discover_lock
+    if _discover_lock is None:
+        _discover_lock = asyncio.Lock()
+    async with _discover_lock:
+        cached = _discover_cache.get(backend)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        loop = asyncio.get_running_loop()
+        devices = await loop.run_in_executor(
+            None,
+            lambda: discover(backend_identifier=backend)
+        )
+        _discover_cache[backend] = (time.monotonic(), devices)
+        return devices
+
+
+def _invalidate_discover_cache() -> None:
+    """Forget cached discover() results, e.g. after a USB error."""
+    _discover_cache.clear()
+
+
+class _USBPrintWorker:
+    """
+    Long-lived thread that owns one open pyusb handle and sends jobs over it.
+
+    Mirrors brother_ql's send(..., blocking=True): write the instructions,
+    then read status back until the printer reports the print finished
+    and is waiting for the next job, or SEND_TIMEOUT_SEC passes. The handle
+    is reopened when the device path changes, and closed after any error
+    so the next job (the adapter's retry) starts with a fresh open.
+    """
+
+    SEND_TIMEOUT_SEC = 10.0
+
+    def __init__(self, name: str):
+        self._name = name
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._backend = None
+        self._backend_device: Optional[str] = None
+
+    def submit(self, device: str, instructions: bytes) -> Future:
+        """Queue instructions for the device; the future resolves to the send status."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+        future: Future = Future()
+        self._jobs.put((device, instructions, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            device, instructions, future = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._send(device, instructions))
+            except Exception as e:
+                self._close()
+                future.set_exception(e)
+
+    def _close(self) -> None:
+        if self._backend is not None:
+            try:
+                self._backend.dispose()
+            except Exception as e:
+                logger.debug(f"Closing USB handle for {self._backend_device} failed: {e}")
+        self._backend = None
+        self._backend_device = None
+
+    def _send(self, device: str, instructions: bytes) -> dict:
+        if self._backend is None or self._backend_device != device:
+            self._close()
+            self._backend = BrotherQLBackendPyUSB(device)
+            self._backend_device = device
+
+        status = {"outcome": "sent", "printer_state": None, "did_print": False,
+                  "ready_for_next_job": False}
+        start = time.monotonic()
+        self._backend.write(instructions)
+
+        while time.monotonic() - start < self.SEND_TIMEOUT_SEC:
+            data = self._backend.read()
+            if not data:
+                time.sleep(0.005)
+                continue
+            try:
+                result = interpret_response(data)
+            except ValueError:
+                logger.debug(f"Couldn't understand printer response: {data!r}")
+                continue
+            status["printer_state"] = result
+            if result["errors"]:
+                logger.error(f"Printer reported errors: {result['errors']}")
+                status["outcome"] = "error"
+                break
+            if result["status_type"] == "Printing completed":
+                status["did_print"] = True
+                status["outcome"] = "printed"
+            if result["status_type"] == "Phase change" and result["phase_type"] == "Waiting to receive":
+                status["ready_for_next_job"] = True
+            if status["did_print"] and status["ready_for_next_job"]:
+                break
+
+        if not (status["did_print"] and status["ready_for_next_job"]):
+            logger.warning(f"Completion status not received from {device}, print may have failed")
+        return status
+
 
 @dataclass
 class USBDeviceState:
@@ -58,12 +198,19 @@ class USBDeviceState:
 class ResilienceConfig:
     """USB resilience configuration."""
 
+    # Accepted range for health_check_interval_sec; from_dict clamps to it
+    MIN_HEALTH_CHECK_INTERVAL_SEC = 1.0
+    MAX_HEALTH_CHECK_INTERVAL_SEC = 3600.0
+
     auto_reconnect: bool = True
     max_retries: int = 3
     retry_delay_ms: int = 1000
     health_check_interval_sec: float = 30.0
     offline_queue_enabled: bool = True
     offline_queue_timeout_sec: float = 600.0
+    backoff_base_ms: Optional[int] = None  # First retry delay; defaults to retry_delay_ms
+    backoff_max_ms: int = 10000
+    jitter: float = 0.2  # +/- fraction applied to each retry delay
 
     @classmethod
     def from_dict(cls, config: dict) -> "ResilienceConfig":
@@ -73,16 +220,44 @@ class ResilienceConfig:
             auto_reconnect=resilience.get("auto_reconnect", True),
             max_retries=resilience.get("max_retries", 3),
             retry_delay_ms=resilience.get("retry_delay_ms", 1000),
-            health_check_interval_sec=resilience.get("health_check_interval_sec", 30.0),
+            health_check_interval_sec=cls._clamp_health_check_interval(
+                resilience.get("health_check_interval_sec", 30.0)
+            ),
             offline_queue_enabled=resilience.get("offline_queue_enabled", True),
             offline_queue_timeout_sec=resilience.get("offline_queue_timeout_sec", 600.0),
+            backoff_base_ms=resilience.get("backoff_base_ms"),
+            backoff_max_ms=resilience.get("backoff_max_ms", 10000),
+            jitter=resilience.get("jitter", 0.2),
+        )
+
+    @classmethod
+    def _clamp_health_check_interval(cls, interval: float) -> float:
+        """Keep the health check interval within sane bounds, warning if not."""
+        clamped = min(
+            max(interval, cls.MIN_HEALTH_CHECK_INTERVAL_SEC), cls.MAX_HEALTH_CHECK_INTERVAL_SEC
         )
+        if clamped != interval:
+            logger.warning(
+                f"health_check_interval_sec={interval} out of range, using {clamped}"
+            )
+        return clamped
 
     @property
     def retry_delay_sec(self) -> float:
         """Get retry delay in seconds."""
         return self.retry_delay_ms / 1000.0
 
+    def backoff_delay_sec(self, attempt: int) -> float:
+        """
+        Get the delay before retrying after a failed attempt (0-based).
+
+        Doubles from backoff_base_ms up to backoff_max_ms, then applies a
+        random +/- jitter fraction so concurrent retries don't line up.
+        """
+        base_ms = self.backoff_base_ms if self.backoff_base_ms is not None else self.retry_delay_ms
+        delay_ms = min(self.backoff_max_ms, base_ms * 2 ** attempt)
+        return delay_ms / 1000.0 * (1 + random.uniform(-self.jitter, self.jitter))
+
 
 class BrotherQLAdapter(PrinterBase):
     """
@@ -101,12 +276,27 @@ class BrotherQLAdapter(PrinterBase):
         self.device = config.get("device", "")
         self.label = config.get("label", "62")  # 62mm continuous tape
 
+        # Fixed convert() options for every job on this printer
+        self._convert_kwargs = dict(
+            label=self.label,
+            rotate="0",
+            threshold=70,
+            dither=False,
+            compress=False,
+            red=False,
+            dpi_600=False,
+            hq=True,
+            cut=True
+        )
+
         # Resilience configuration
         self.resilience = ResilienceConfig.from_dict(config)
 
         # USB device state tracking
         self._device_state = USBDeviceState()
-        self._lock = asyncio.Lock()  # Protect device access during print/reconnect
+        # Jobs reach the device one at a time: the PrintQueue runs one job per
+        # printer, and the worker thread owns the USB handle
+        self._usb_worker = _USBPrintWorker(f"brother-ql-{printer_id}")
 
         # Initial status based on device configuration
         if not self.device:
@@ -115,7 +305,7 @@ class BrotherQLAdapter(PrinterBase):
             # Will be verified on first status check
             self._device_state.is_connected = True
 
-    @property
+    @functools.cached_property
     def supported_content_types(self) -> list[str]:
         return ["image/png"]
 
@@ -153,35 +343,35 @@ class BrotherQLAdapter(PrinterBase):
             self._device_state.last_error = str(e)
             return PrinterStatus.OFFLINE
 
-    async def _probe_device(self) -> bool:
+    def _matches_device(self, device_id: str) -> bool:
         """
-        Check if USB device is accessible.
+        Check a discovered identifier against the configured device.
 
-        Uses brother_ql discover to enumerate available devices.
+        Exact match, or for usb:// paths a prefix match since brother_ql
+        appends the serial (e.g. usb://0x04f9:0x2044/XX or _XX). USB hex
+        IDs are compared case-insensitively (0x04F9 == 0x04f9).
         """
-        if not BROTHER_QL_AVAILABLE:
+        if device_id == self.device:
+            return True
+        if not self.device.startswith("usb://"):
             return False
+        return device_id.lower().startswith(self.device.lower())
+
+    async def _probe_device(self) -> bool:
+        """
+        Check if USB device is accessible.
 
+        Uses brother_ql discover to enumerate available devices. Only called
+        from get_status, which has already checked BROTHER_QL_AVAILABLE.
+        """
         try:
-            # Run discovery in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            devices = await loop.run_in_executor(
-                None,
-                lambda: discover(backend_identifier="pyusb")
-            )
+            devices = await _cached_discover("pyusb")
 
             # Check if our configured device is in the list
-            for device_info in devices:
-                device_id = device_info.get("identifier", "")
-                if device_id == self.device:
-                    return True
-
-                # brother_ql may append serial/suffix to device ID (e.g., usb://0x04f9:0x2044_XX)
-                # Match if discovered device starts with our configured device path
-                if self.device.startswith("usb://") and device_id.startswith(self.device):
-                    return True
-
-            return False
+            return any(
+                self._matches_device(device_info.get("identifier", ""))
+                for device_info in devices
+            )
 
         except Exception as e:
             logger.debug(f"Device discovery failed: {e}")
@@ -230,21 +420,20 @@ class BrotherQLAdapter(PrinterBase):
 
         for attempt in range(self.resilience.max_retries):
             try:
-                async with self._lock:
-                    result = await self._do_print(job)
-                    if result.success:
-                        self._device_state.consecutive_failures = 0
-                        return result
-                    else:
-                        # Print returned failure but didn't raise - don't retry
-                        return result
+                result = await self._do_print(job)
+                if result.success:
+                    self._device_state.consecutive_failures = 0
+                    return result
+                else:
+                    # Print returned failure but didn't raise - don't retry
+                    return result
 
             except Exception as e:
                 last_error = e
                 error_type = classify_usb_error(e)
                 self._device_state.consecutive_failures += 1
 
-                if error_type == USBErrorType.RECOVERABLE:
+                if error_type is USBErrorType.RECOVERABLE:
                     logger.warning(
                         f"[JOB_RETRY] USB error on attempt {attempt + 1}/{self.resilience.max_retries} "
                         f"for job {job.id}: {e}"
@@ -256,7 +445,7 @@ class BrotherQLAdapter(PrinterBase):
                         reconnected = await self._attempt_reconnect()
                         if reconnected:
                             logger.info(f"Reconnected, retrying job {job.id}")
-                        await asyncio.sleep(self.resilience.retry_delay_sec)
+                        await asyncio.sleep(self.resilience.backoff_delay_sec(attempt))
                 else:
                     # Non-recoverable error, fail immediately
                     logger.error(f"Non-recoverable print error for job {job.id}: {e}")
@@ -273,45 +462,44 @@ class BrotherQLAdapter(PrinterBase):
             error_code="USB_ERROR"
         )
 
+    def _render(self, data: bytes) -> bytes:
+        """
+        Decode PNG data and convert it to brother_ql raster instructions.
+
+        Runs on the CPU pool, so opening the PNG happens off the event loop
+        too. BytesIO over bytes shares the buffer rather than copying it.
+        """
+        # A fresh raster per job: it accumulates output and page state
+        qlr = BrotherQLRaster(self.model)
+
+        image = Image.open(BytesIO(data))
+        image.load()
+
+        return convert(qlr=qlr, images=[image], **self._convert_kwargs)
+
     async def _do_print(self, job: PrintJob) -> PrintResult:
         """
         Execute the actual print operation.
         """
         try:
-            # Convert image data to brother_ql raster format
-            qlr = BrotherQLRaster(self.model)
-
-            image = Image.open(BytesIO(job.data))
-
-            # Run conversion in executor (CPU-bound)
-            loop = asyncio.get_event_loop()
-            instructions = await loop.run_in_executor(
-                None,
-                lambda: convert(
-                    qlr=qlr,
-                    images=[image],
-                    label=self.label,
-                    rotate="0",
-                    threshold=70,
-                    dither=False,
-                    compress=False,
-                    red=False,
-                    dpi_600=False,
-                    hq=True,
-                    cut=True
-                )
-            )
-
-            # Send to printer (I/O bound, run in executor)
-            await loop.run_in_executor(
-                None,
-                lambda: send(
-                    instructions=instructions,
-                    printer_identifier=self.device,
-                    backend_identifier="pyusb",
-                    blocking=True
+            # Decode and convert on the CPU pool
+            loop = asyncio.get_running_loop()
+            instructions = await loop.run_in_executor(_cpu_pool, self._render, job.data)
+
+            # Send to printer (I/O bound, off the event loop)
+            if PERSISTENT_USB_AVAILABLE and self.device.startswith("usb://"):
+                # Reuses this adapter's open USB handle across jobs
+                await asyncio.wrap_future(self._usb_worker.submit(self.device, instructions))
+            else:
+                await loop.run_in_executor(
+                    None,
+                    lambda: send(
+                        instructions=instructions,
+                        printer_identifier=self.device,
+                        backend_identifier="pyusb",
+                        blocking=True
+                    )
                 )
-            )
 
             # Update state on success
             self._device_state.is_connected = True
@@ -323,6 +511,9 @@ class BrotherQLAdapter(PrinterBase):
 
         except Exception as e:
             logger.error(f"Print failed for job {job.id}: {e}")
+            if classify_usb_error(e) is USBErrorType.RECOVERABLE:
+                # The device may have re-enumerated; make reconnect look again
+                _invalidate_discover_cache()
             # Re-raise to let retry wrapper handle it
             raise
 
@@ -330,7 +521,8 @@ class BrotherQLAdapter(PrinterBase):
         """
         Attempt to rediscover and reconnect to USB device.
 
-        Returns True if device was found, False otherwise.
+        Returns True if device was found, False otherwise. Only reached from
+        print's retry path, after print has checked BROTHER_QL_AVAILABLE.
         """
         self._device_state.reconnect_attempts += 1
         logger.info(
@@ -340,16 +532,8 @@ class BrotherQLAdapter(PrinterBase):
 
         self._emit_event("USB_DISCONNECTED", self.device)
 
-        if not BROTHER_QL_AVAILABLE:
-            return False
-
         try:
-            # Run discovery in executor
-            loop = asyncio.get_event_loop()
-            devices = await loop.run_in_executor(
-                None,
-                lambda: discover(backend_identifier="pyusb")
-            )
+            devices = await _cached_discover("pyusb")
 
             if not devices:
                 logger.warning("No Brother QL devices found during reconnect")
@@ -357,11 +541,7 @@ class BrotherQLAdapter(PrinterBase):
 
             # Look for our configured device
             for device_info in devices:
-                device_id = device_info.get("identifier", "")
-                # Exact match or prefix match (brother_ql may append serial suffix)
-                if device_id == self.device or (
-                    self.device.startswith("usb://") and device_id.startswith(self.device)
-                ):
+                if self._matches_device(device_info.get("identifier", "")):
                     self._device_state.is_connected = True
                     self._device_state.last_seen = datetime.now()
                     self._emit_event("USB_RECONNECTED", self.device)
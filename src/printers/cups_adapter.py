@@ -5,9 +5,13 @@ Requires: pycups package
 Works with any CUPS-configured printer (network or local).
 """
 
+import asyncio
+import functools
 import logging
 import os
 import tempfile
+import threading
+import time
 
 from .base import PrinterBase, PrinterStatus, PrintJob, PrintResult
 
@@ -20,6 +24,26 @@ except ImportError:
     CUPS_AVAILABLE = False
     logger.warning("pycups package not available - CUPSAdapter will not function")
 
+# startDocument/writeRequestData return this while CUPS expects more data
+HTTP_CONTINUE = getattr(cups, "HTTP_CONTINUE", 100) if CUPS_AVAILABLE else 100
+
+# Errors after which the connection is dropped and rebuilt (e.g. cupsd restarted)
+CONNECTION_ERRORS: tuple[type[Exception], ...] = (RuntimeError,)
+if CUPS_AVAILABLE:
+    CONNECTION_ERRORS += tuple(
+        getattr(cups, name) for name in ("IPPError", "HTTPError") if hasattr(cups, name)
+    )
+
+
+class DocumentRejectedError(Exception):
+    """Raised when CUPS refuses a job's document data (the connection is fine)."""
+    pass
+
+
+# getPrinters() returns every queue on the server, so one call is shared by
+# all adapters on that server for this long
+PRINTERS_CACHE_TTL_SEC = 1.0
+
 
 class CUPSAdapter(PrinterBase):
     """
@@ -30,14 +54,30 @@ class CUPSAdapter(PrinterBase):
         cups_server: CUPS server address (default: localhost)
     """
 
+    # CUPS printer-state: 3=idle, 4=printing, 5=stopped (anything else is offline)
+    _STATE_MAP = {
+        3: PrinterStatus.READY,
+        4: PrinterStatus.BUSY,
+        5: PrinterStatus.OFFLINE,
+    }
+
+    # cups_server -> (fetched at, getPrinters() result), shared by all instances.
+    # Each server gets its own lock (created on first use, inside the running
+    # loop) so a slow server doesn't hold up status checks for the others.
+    _printers_cache: dict[str, tuple[float, dict]] = {}
+    _cache_locks: dict[str, asyncio.Lock] = {}
+
     def __init__(self, printer_id: str, name: str, config: dict):
         super().__init__(printer_id, name, config)
         self.cups_name = config.get("cups_name", "")
         self.cups_server = config.get("cups_server", "localhost")
         self._conn = None
+        # pycups calls block, so they run in the executor; this serializes
+        # them since one cups.Connection isn't safe to share across threads
+        self._conn_lock = threading.Lock()
 
     def _get_connection(self):
-        """Get or create CUPS connection."""
+        """Get or create CUPS connection (blocking, call from the executor)."""
         if not CUPS_AVAILABLE:
             return None
         if self._conn is None:
@@ -46,10 +86,110 @@ class CUPSAdapter(PrinterBase):
             self._conn = cups.Connection()
         return self._conn
 
-    @property
+    @functools.cached_property
     def supported_content_types(self) -> list[str]:
         return ["application/pdf"]
 
+    async def _get_printers_cached(self, ttl: float = PRINTERS_CACHE_TTL_SEC) -> dict:
+        """Fetch getPrinters() for this server, at most once per ttl."""
+        cls = type(self)
+        lock = cls._cache_locks.get(self.cups_server)
+        if lock is None:
+            lock = cls._cache_locks[self.cups_server] = asyncio.Lock()
+        async with lock:
+            cached = cls._printers_cache.get(self.cups_server)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            loop = asyncio.get_running_loop()
+            printers = await loop.run_in_executor(None, self._fetch_printers)
+            cls._printers_cache[self.cups_server] = (time.monotonic(), printers)
+            return printers
+
+    def _call_cups(self, fn):
+        """
+        Call fn(connection), rebuilding the connection and retrying once on
+        a connection error. Callers hold _conn_lock.
+        """
+        try:
+            return fn(self._get_connection())
+        except CONNECTION_ERRORS as e:
+            logger.warning(f"CUPS call failed ({e}), reconnecting to {self.cups_server}")
+            self._conn = None
+            return fn(self._get_connection())
+
+    def _fetch_printers(self) -> dict:
+        """Blocking getPrinters() call."""
+        with self._conn_lock:
+            return self._call_cups(lambda conn: conn.getPrinters())
+
+    def _submit_file(self, job: PrintJob) -> int:
+        """
+        Blocking job submission; returns the CUPS job ID.
+
+        Streams the PDF from memory with createJob/startDocument/
+        writeRequestData/finishDocument. Older pycups without that API
+        falls back to printFile() on a temp file.
+        """
+        # Build print options
+        options = {}
+        if job.copies > 1:
+            options["copies"] = str(job.copies)
+        title = job.filename or "document"
+
+        with self._conn_lock:
+            # Checked through _call_cups so a failed connection is rebuilt first
+            if not self._call_cups(lambda conn: hasattr(conn, "createJob")):
+                return self._call_cups(
+                    lambda conn: self._submit_temp_file(conn, job, title, options)
+                )
+
+            # Only job creation is retried: once a job exists, retrying
+            # would submit a duplicate
+            cups_job_id = self._call_cups(
+                lambda conn: conn.createJob(self.cups_name, title, options)
+            )
+            conn = self._conn
+            try:
+                status = conn.startDocument(self.cups_name, cups_job_id, title, "application/pdf", 1)
+                if status == HTTP_CONTINUE:
+                    status = conn.writeRequestData(job.data, len(job.data))
+                if status != HTTP_CONTINUE:
+                    raise DocumentRejectedError(
+                        f"CUPS rejected document data (HTTP status {status})"
+                    )
+                conn.finishDocument(self.cups_name)
+            except CONNECTION_ERRORS:
+                self._conn = None  # Reconnect on the next call
+                self._cancel_job(cups_job_id)
+                raise
+            except Exception:
+                self._cancel_job(cups_job_id)
+                raise
+            return cups_job_id
+
+    def _cancel_job(self, cups_job_id: int) -> None:
+        """
+        Best-effort cancel of a job left without its document, so it isn't
+        orphaned in CUPS. Callers hold _conn_lock.
+        """
+        try:
+            self._call_cups(lambda conn: conn.cancelJob(cups_job_id))
+        except Exception as e:
+            logger.warning(f"Could not cancel CUPS job {cups_job_id}: {e}")
+
+    def _submit_temp_file(self, conn, job: PrintJob, title: str, options: dict) -> int:
+        """printFile() fallback; this API needs a file path, so write a temp file."""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(job.data)
+            temp_path = f.name
+
+        try:
+            return conn.printFile(self.cups_name, temp_path, title, options)
+        finally:
+            # Clean up temp file
+            os.unlink(temp_path)
+
     async def get_status(self) -> PrinterStatus:
         if not CUPS_AVAILABLE:
             return PrinterStatus.ERROR
@@ -57,22 +197,13 @@ class CUPSAdapter(PrinterBase):
             return PrinterStatus.OFFLINE
 
         try:
-            conn = self._get_connection()
-            printers = conn.getPrinters()
+            printers = await self._get_printers_cached()
 
             if self.cups_name not in printers:
                 return PrinterStatus.OFFLINE
 
-            printer_info = printers[self.cups_name]
-            state = printer_info.get("printer-state", 0)
-
-            # CUPS states: 3=idle, 4=printing, 5=stopped
-            if state == 3:
-                return PrinterStatus.READY
-            elif state == 4:
-                return PrinterStatus.BUSY
-            else:
-                return PrinterStatus.OFFLINE
+            state = printers[self.cups_name].get("printer-state", 0)
+            return self._STATE_MAP.get(state, PrinterStatus.OFFLINE)
 
         except Exception as e:
             logger.error(f"Failed to get CUPS status: {e}")
@@ -107,38 +238,16 @@ class CUPSAdapter(PrinterBase):
             )
 
         try:
-            conn = self._get_connection()
+            loop = asyncio.get_running_loop()
+            cups_job_id = await loop.run_in_executor(None, self._submit_file, job)
 
-            # CUPS requires a file path, so we write to temp file
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-                f.write(job.data)
-                temp_path = f.name
+            logger.info(f"Submitted job {job.id} to CUPS as job {cups_job_id}")
 
-            try:
-                # Build print options
-                options = {}
-                if job.copies > 1:
-                    options["copies"] = str(job.copies)
-
-                # Submit job
-                cups_job_id = conn.printFile(
-                    self.cups_name,
-                    temp_path,
-                    job.filename or "document",
-                    options
-                )
-
-                logger.info(f"Submitted job {job.id} to CUPS as job {cups_job_id}")
-
-                return PrintResult(
-                    success=True,
-                    job_id=job.id,
-                    message=f"Submitted to CUPS (job {cups_job_id})"
-                )
-
-            finally:
-                # Clean up temp file
-                os.unlink(temp_path)
+            return PrintResult(
+                success=True,
+                job_id=job.id,
+                message=f"Submitted to CUPS (job {cups_job_id})"
+            )
 
         except Exception as e:
             logger.error(f"CUPS print failed for job {job.id}: {e}")
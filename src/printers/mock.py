@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 
 from .base import PrinterBase, PrinterStatus, PrintJob, PrintResult
@@ -15,7 +16,7 @@ class MockLabelPrinter(PrinterBase):
         self._print_delay = config.get("print_delay", 0.5) if config else 0.5
         self._fail_rate = config.get("fail_rate", 0.0) if config else 0.0  # For testing error handling
 
-    @property
+    @functools.cached_property
     def supported_content_types(self) -> list[str]:
         return ["image/png"]
 
@@ -25,6 +26,7 @@ class MockLabelPrinter(PrinterBase):
     def set_status(self, status: PrinterStatus) -> None:
         """Allow tests to set printer status."""
         self._status = status
+        self.invalidate_status_cache()
 
     def validate_job(self, job: PrintJob) -> tuple[bool, str]:
         if job.content_type not in self.supported_content_types:
@@ -44,7 +46,8 @@ class MockLabelPrinter(PrinterBase):
 
         # Simulate print time
         self._status = PrinterStatus.BUSY
-        await asyncio.sleep(self._print_delay)
+        if self._print_delay > 0:
+            await asyncio.sleep(self._print_delay)
         self._status = PrinterStatus.READY
 
         logger.info(f"[MOCK] Printed label job {job.id}: {job.filename} ({len(job.data)} bytes)")
@@ -64,7 +67,7 @@ class MockDocumentPrinter(PrinterBase):
         self._status = PrinterStatus.READY
         self._print_delay = config.get("print_delay", 1.0) if config else 1.0
 
-    @property
+    @functools.cached_property
     def supported_content_types(self) -> list[str]:
         return ["application/pdf"]
 
@@ -74,6 +77,7 @@ class MockDocumentPrinter(PrinterBase):
     def set_status(self, status: PrinterStatus) -> None:
         """Allow tests to set printer status."""
         self._status = status
+        self.invalidate_status_cache()
 
     def validate_job(self, job: PrintJob) -> tuple[bool, str]:
         if job.content_type not in self.supported_content_types:
@@ -92,7 +96,8 @@ class MockDocumentPrinter(PrinterBase):
             )
 
         self._status = PrinterStatus.BUSY
-        await asyncio.sleep(self._print_delay)
+        if self._print_delay > 0:
+            await asyncio.sleep(self._print_delay)
         self._status = PrinterStatus.READY
 
         logger.info(f"[MOCK] Printed document job {job.id}: {job.filename} ({len(job.data)} bytes)")
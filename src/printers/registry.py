@@ -1,17 +1,28 @@
+import asyncio
+import logging
 from typing import Optional
 
 from .base import PrinterBase, PrinterStatus
 
+logger = logging.getLogger(__name__)
+
 
 class PrinterRegistry:
     """Registry for managing multiple printer adapters."""
 
     def __init__(self):
         self._printers: dict[str, PrinterBase] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration, for callers caching list_all()."""
+        return self._version
 
     def register(self, printer: PrinterBase) -> None:
         """Register a printer adapter."""
         self._printers[printer.printer_id] = printer
+        self._version += 1
 
     def get(self, printer_id: str) -> Optional[PrinterBase]:
         """Get a printer by ID."""
@@ -22,8 +33,28 @@ class PrinterRegistry:
         return list(self._printers.values())
 
     async def get_all_status(self) -> dict[str, PrinterStatus]:
-        """Get status of all printers."""
+        """
+        Get status of all printers.
+
+        Probes run concurrently, so this takes as long as the slowest printer
+        rather than the sum of all of them. A probe that raises is reported
+        as OFFLINE. Successful probes refresh each printer's status cache.
+        """
+        if not self._printers:
+            return {}
+
+        printers = tuple(self._printers.values())
+        results = await asyncio.gather(
+            *(printer.get_status() for printer in printers),
+            return_exceptions=True
+        )
+
         statuses = {}
-        for printer_id, printer in self._printers.items():
-            statuses[printer_id] = await printer.get_status()
+        for printer, result in zip(printers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Status check failed for {printer.printer_id}: {result}")
+                result = PrinterStatus.OFFLINE
+            else:
+                printer.cache_status(result)
+            statuses[printer.printer_id] = result
         return statuses
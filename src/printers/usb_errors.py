@@ -4,7 +4,10 @@ USB error classification for resilient printer connections.
 Classifies USB errors as recoverable (can retry after reconnect) or permanent.
 """
 
+import functools
+import re
 from enum import Enum, auto
+from typing import Optional
 
 
 class USBErrorType(Enum):
@@ -24,6 +27,9 @@ RECOVERABLE_ERRNO = {
     121,  # EREMOTEIO - Remote I/O error (USB)
 }
 
+# Same errnos as a bitmask: bit N is set when errno N is recoverable
+_RECOVERABLE_ERRNO_MASK = sum(1 << errno for errno in RECOVERABLE_ERRNO)
+
 # Error message substrings that indicate recoverable USB issues
 RECOVERABLE_MESSAGES = (
     "no backend",
@@ -39,6 +45,26 @@ RECOVERABLE_MESSAGES = (
     "operation timed out",
 )
 
+# All of the above as one pattern, so a message is scanned once
+_RECOVERABLE_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in RECOVERABLE_MESSAGES), re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_recoverable(exc_type: type, errno: Optional[int], message: str) -> bool:
+    """
+    Check a single exception (not its causes). Cached, since a flaky
+    device tends to raise the same error over and over in retry loops.
+    """
+    # Check OSError errno values
+    if issubclass(exc_type, OSError) and errno is not None:
+        if 0 <= errno < 256 and (_RECOVERABLE_ERRNO_MASK >> errno) & 1:
+            return True
+
+    # Check for pyusb-specific errors and common USB error messages
+    return _RECOVERABLE_RE.search(message) is not None
+
 
 def classify_usb_error(exception: Exception) -> USBErrorType:
     """
@@ -50,21 +76,22 @@ def classify_usb_error(exception: Exception) -> USBErrorType:
     Returns:
         USBErrorType indicating if the error is recoverable
     """
-    # Check OSError errno values
-    if isinstance(exception, OSError):
-        if exception.errno in RECOVERABLE_ERRNO:
+    # Walk the exception and what led to it (some libraries wrap USB errors,
+    # others raise a new error inside their except block), stopping if the
+    # chain loops back on itself
+    seen: set[int] = set()
+    current: Optional[BaseException] = exception
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+
+        errno = getattr(current, "errno", None)
+        if _is_recoverable(type(current), errno if isinstance(errno, int) else None, str(current)):
             return USBErrorType.RECOVERABLE
 
-    # Check for pyusb-specific errors and common USB error messages
-    error_msg = str(exception).lower()
-    if any(phrase in error_msg for phrase in RECOVERABLE_MESSAGES):
-        return USBErrorType.RECOVERABLE
-
-    # Check nested exceptions (some libraries wrap USB errors)
-    if exception.__cause__:
-        cause_result = classify_usb_error(exception.__cause__)
-        if cause_result == USBErrorType.RECOVERABLE:
-            return USBErrorType.RECOVERABLE
+        if current.__cause__ is not None or current.__suppress_context__:
+            current = current.__cause__
+        else:
+            current = current.__context__
 
     return USBErrorType.UNKNOWN
 
@@ -79,4 +106,4 @@ def is_recoverable_error(exception: Exception) -> bool:
     Returns:
         True if the error might be resolved by USB reconnection
     """
-    return classify_usb_error(exception) == USBErrorType.RECOVERABLE
+    return classify_usb_error(exception) is USBErrorType.RECOVERABLE
@@ -11,7 +11,9 @@ Resilience features:
 """
 
 import asyncio
+import itertools
 import logging
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -22,6 +24,9 @@ from src.printers.base import PrintJob, PrintResult
 
 logger = logging.getLogger(__name__)
 
+# Type alias for job lifecycle callbacks: (printer_id, job_id) -> None
+JobCallback = Callable[[str, str], None]
+
 
 class JobStatus(Enum):
     QUEUED = "queued"
@@ -33,7 +38,7 @@ class JobStatus(Enum):
     EXPIRED = "expired"  # Timed out while waiting for offline printer
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedJob:
     job: PrintJob
     status: JobStatus = JobStatus.QUEUED
@@ -44,6 +49,58 @@ class QueuedJob:
     result: Optional[PrintResult] = None
     error: Optional[str] = None
 
+    # ISO strings for the timestamps above, formatted once when each is set
+    # (set them with the methods below) rather than on every API read
+    queued_at_iso: str = field(init=False, repr=False)
+    expires_at_iso: Optional[str] = field(init=False, default=None, repr=False)
+    started_at_iso: Optional[str] = field(init=False, default=None, repr=False)
+    completed_at_iso: Optional[str] = field(init=False, default=None, repr=False)
+
+    # time.monotonic() deadline for offline jobs; expiry is checked against
+    # this so wall-clock adjustments don't expire jobs early or late
+    expires_at_mono: Optional[float] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.queued_at_iso = self.queued_at.isoformat()
+        if self.expires_at:
+            self.expires_at_iso = self.expires_at.isoformat()
+        if self.started_at:
+            self.started_at_iso = self.started_at.isoformat()
+        if self.completed_at:
+            self.completed_at_iso = self.completed_at.isoformat()
+
+    def set_started(self, at: datetime) -> None:
+        self.started_at = at
+        self.started_at_iso = at.isoformat()
+
+    def set_completed(self, at: datetime) -> None:
+        self.completed_at = at
+        self.completed_at_iso = at.isoformat()
+
+    def clear_expiry(self) -> None:
+        self.expires_at = None
+        self.expires_at_iso = None
+        self.expires_at_mono = None
+
+    def to_dict(self) -> dict:
+        """Convert to API response dict."""
+        result = {
+            "id": self.job.id,
+            "printer_id": self.job.printer_id,
+            "filename": self.job.filename,
+            "status": self.status.value,
+            "queued_at": self.queued_at_iso,
+            "started_at": self.started_at_iso,
+            "completed_at": self.completed_at_iso,
+            "error": self.error,
+        }
+
+        # Include expiration for offline jobs
+        if self.expires_at_iso:
+            result["expires_at"] = self.expires_at_iso
+
+        return result
+
 
 class PrintQueue:
     """
@@ -51,6 +108,9 @@ class PrintQueue:
 
     Jobs are processed sequentially in FIFO order.
     Supports offline queuing with configurable expiration.
+
+    There is no lock: every state change happens between awaits, so on the
+    event loop's single thread each one runs without interleaving.
     """
 
     def __init__(
@@ -58,18 +118,38 @@ class PrintQueue:
         printer_id: str,
         print_handler: Callable[[PrintJob], Awaitable[PrintResult]],
         max_queue_size: int = 100,
-        offline_queue_timeout_sec: float = 600.0  # 10 minutes default
+        offline_queue_timeout_sec: float = 600.0,  # 10 minutes default
+        on_job_added: Optional[JobCallback] = None,
+        on_job_evicted: Optional[JobCallback] = None
     ):
         self.printer_id = printer_id
         self._print_handler = print_handler
         self._max_queue_size = max_queue_size
         self._offline_queue_timeout_sec = offline_queue_timeout_sec
 
-        self._queue: deque[QueuedJob] = deque()
+        # Called with (printer_id, job_id) when a job enters the queue and when
+        # it drops out of history, so callers can keep a job index in sync
+        self._on_job_added = on_job_added
+        self._on_job_evicted = on_job_evicted
+
+        # Pending jobs, split by status so the processor never scans past
+        # offline jobs. Cancelled/expired jobs are skipped when reached, and
+        # cancel() compacts the deque so they can't pile up; the counts
+        # track only the jobs still waiting.
+        self._ready: deque[QueuedJob] = deque()
+        self._offline: deque[QueuedJob] = deque()
+        self._ready_count = 0
+        self._offline_count = 0
+
+        # Every job this queue still knows about (pending, current, history)
+        self._jobs_by_id: dict[str, QueuedJob] = {}
+
         self._current_job: Optional[QueuedJob] = None
         self._history: deque[QueuedJob] = deque(maxlen=50)  # Keep last 50 completed jobs
-        self._processing = False
-        self._lock = asyncio.Lock()
+
+        # One long-lived processor task per queue, woken by _wakeup
+        self._wakeup = asyncio.Event()
+        self._processor_task: Optional[asyncio.Task] = None
 
         # Offline state tracking
         self._printer_online = True
@@ -77,19 +157,17 @@ class PrintQueue:
 
     async def add(self, job: PrintJob) -> QueuedJob:
         """Add a job to the queue."""
-        async with self._lock:
-            if len(self._queue) >= self._max_queue_size:
-                raise QueueFullError(f"Queue full (max {self._max_queue_size} jobs)")
+        self._check_capacity()
 
-            queued = QueuedJob(job=job)
-            self._queue.append(queued)
-            logger.info(f"Job {job.id} added to queue for {self.printer_id}")
+        queued = QueuedJob(job=job)
+        self._ready.append(queued)
+        self._ready_count += 1
+        self._track(queued)
+        logger.info(f"Job {job.id} added to queue for {self.printer_id}")
 
-            # Start processing if not already running
-            if not self._processing:
-                asyncio.create_task(self._process_queue())
+        self._start_processing()
 
-            return queued
+        return queued
 
     async def add_offline(self, job: PrintJob) -> QueuedJob:
         """
@@ -97,28 +175,29 @@ class PrintQueue:
 
         Job will have QUEUED_OFFLINE status and an expiration time.
         """
-        async with self._lock:
-            if len(self._queue) >= self._max_queue_size:
-                raise QueueFullError(f"Queue full (max {self._max_queue_size} jobs)")
-
-            expires_at = datetime.now() + timedelta(seconds=self._offline_queue_timeout_sec)
-            queued = QueuedJob(
-                job=job,
-                status=JobStatus.QUEUED_OFFLINE,
-                expires_at=expires_at
-            )
-            self._queue.append(queued)
-
-            logger.info(
-                f"[JOB_QUEUED_OFFLINE] Job {job.id} queued offline for {self.printer_id}, "
-                f"expires at {expires_at.isoformat()}"
-            )
-
-            # Start expiry checker if not running
-            if self._expiry_task is None or self._expiry_task.done():
-                self._expiry_task = asyncio.create_task(self._check_expired_jobs())
-
-            return queued
+        self._check_capacity()
+
+        timeout = self._offline_queue_timeout_sec
+        queued = QueuedJob(
+            job=job,
+            status=JobStatus.QUEUED_OFFLINE,
+            expires_at=datetime.now() + timedelta(seconds=timeout),
+            expires_at_mono=time.monotonic() + timeout
+        )
+        self._offline.append(queued)
+        self._offline_count += 1
+        self._track(queued)
+
+        logger.info(
+            f"[JOB_QUEUED_OFFLINE] Job {job.id} queued offline for {self.printer_id}, "
+            f"expires at {queued.expires_at_iso}"
+        )
+
+        # Start expiry checker if not running
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._check_expired_jobs())
+
+        return queued
 
     async def on_printer_online(self) -> int:
         """
@@ -130,13 +209,16 @@ class PrintQueue:
         self._printer_online = True
         promoted_count = 0
 
-        async with self._lock:
-            for job in self._queue:
-                if job.status == JobStatus.QUEUED_OFFLINE:
-                    job.status = JobStatus.QUEUED
-                    job.expires_at = None  # No longer expires
-                    promoted_count += 1
-                    logger.info(f"Job {job.job.id} promoted from offline queue")
+        while self._offline:
+            job = self._offline.popleft()
+            if job.status == JobStatus.QUEUED_OFFLINE:
+                job.status = JobStatus.QUEUED
+                job.clear_expiry()  # No longer expires
+                self._ready.append(job)
+                promoted_count += 1
+                logger.info(f"Job {job.job.id} promoted from offline queue")
+        self._offline_count = 0
+        self._ready_count += promoted_count
 
         if promoted_count > 0:
             logger.info(
@@ -144,8 +226,8 @@ class PrintQueue:
             )
 
         # Trigger queue processing
-        if not self._processing and self._queue:
-            asyncio.create_task(self._process_queue())
+        if self._ready_count:
+            self._start_processing()
 
         return promoted_count
 
@@ -154,154 +236,211 @@ class PrintQueue:
         self._printer_online = False
         logger.info(f"[PRINTER_OFFLINE] {self.printer_id}: Queue will hold jobs")
 
+    @property
+    def _pending_count(self) -> int:
+        """Jobs waiting to print, online or offline (not the current job)."""
+        return self._ready_count + self._offline_count
+
+    def _check_capacity(self) -> None:
+        """Raise QueueFullError if no more jobs can be queued."""
+        if self._pending_count >= self._max_queue_size:
+            raise QueueFullError(f"Queue full (max {self._max_queue_size} jobs)")
+
+    def _start_processing(self) -> None:
+        """Wake the processor task, starting it on first use."""
+        self._wakeup.set()
+        if self._processor_task is None or self._processor_task.done():
+            self._processor_task = asyncio.create_task(self._process_queue())
+
+    async def close(self) -> None:
+        """Stop the background tasks. Pending jobs are left as they are."""
+        for task in (self._processor_task, self._expiry_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._processor_task = None
+        self._expiry_task = None
+
+    def _track(self, queued: QueuedJob) -> None:
+        """Index a newly queued job and notify the owner."""
+        self._jobs_by_id[queued.job.id] = queued
+        if self._on_job_added:
+            self._on_job_added(self.printer_id, queued.job.id)
+
+    def _archive(self, job: QueuedJob) -> None:
+        """Move a finished job into history, evicting the oldest if full."""
+        if len(self._history) == self._history.maxlen:
+            evicted_id = self._history[0].job.id
+            self._jobs_by_id.pop(evicted_id, None)
+            if self._on_job_evicted:
+                self._on_job_evicted(self.printer_id, evicted_id)
+        self._history.append(job)
+
+    @staticmethod
+    def _compact(pending: deque[QueuedJob], status: JobStatus, live_count: int) -> None:
+        """
+        Drop cancelled jobs from a pending deque so they don't pile up (each
+        one still holds its print data). Dead jobs at the head are popped
+        right away; the rest of the deque is rebuilt once dead jobs outnumber
+        the live ones, keeping the cost amortized O(1) per cancel.
+        """
+        while pending and pending[0].status != status:
+            pending.popleft()
+        if len(pending) > 2 * live_count:
+            live = [queued for queued in pending if queued.status == status]
+            pending.clear()
+            pending.extend(live)
+
     async def _check_expired_jobs(self) -> None:
-        """Background task to expire old offline jobs."""
+        """
+        Background task to expire old offline jobs.
+
+        Every offline job gets the same timeout, so _offline is ordered by
+        expiry and the task only has to sleep until its first job expires.
+        """
         while True:
-            await asyncio.sleep(60)  # Check every minute
-
-            now = datetime.now()
-            expired_jobs: list[QueuedJob] = []
-
-            async with self._lock:
-                # Find expired offline jobs
-                for job in list(self._queue):
-                    if (job.status == JobStatus.QUEUED_OFFLINE
-                            and job.expires_at
-                            and job.expires_at < now):
-                        expired_jobs.append(job)
-
-                # Expire them
-                for job in expired_jobs:
-                    job.status = JobStatus.EXPIRED
-                    job.completed_at = now
-                    job.error = "Job expired while printer offline"
-                    self._queue.remove(job)
-                    self._history.append(job)
-                    logger.warning(f"[JOB_EXPIRED] Job {job.job.id} expired after waiting for offline printer")
+            # Drop jobs promoted, cancelled or expired since they were queued
+            while self._offline and self._offline[0].status != JobStatus.QUEUED_OFFLINE:
+                self._offline.popleft()
 
             # Stop checker if no more offline jobs
-            has_offline_jobs = any(
-                j.status == JobStatus.QUEUED_OFFLINE for j in self._queue
-            )
-            if not has_offline_jobs:
+            if not self._offline:
                 logger.debug("No more offline jobs, stopping expiry checker")
                 return
 
+            job = self._offline[0]
+            delay = job.expires_at_mono - time.monotonic()
+
+            if delay <= 0:
+                self._offline.popleft()
+                job.status = JobStatus.EXPIRED
+                job.set_completed(datetime.now())
+                job.error = "Job expired while printer offline"
+                self._offline_count -= 1
+                self._archive(job)
+                logger.warning(f"[JOB_EXPIRED] Job {job.job.id} expired after waiting for offline printer")
+                continue
+
+            await asyncio.sleep(delay)
+
     async def _process_queue(self) -> None:
-        """Process jobs from the queue."""
-        self._processing = True
-
-        try:
-            while True:
-                async with self._lock:
-                    if not self._queue:
-                        self._processing = False
-                        return
-
-                    # Skip QUEUED_OFFLINE jobs (they're waiting for printer)
-                    next_job = None
-                    for job in self._queue:
-                        if job.status == JobStatus.QUEUED:
-                            next_job = job
-                            break
-
-                    if next_job is None:
-                        # Only offline jobs remain - stop processing
-                        self._processing = False
-                        return
-
-                    self._queue.remove(next_job)
-                    self._current_job = next_job
-                    self._current_job.status = JobStatus.PRINTING
-                    self._current_job.started_at = datetime.now()
-
-                job = self._current_job
+        """Process jobs from the queue, sleeping until woken when it's empty."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                await self._process_ready_jobs()
+            except Exception as e:
+                logger.error(f"Queue processing error: {e}")
+
+    async def _process_ready_jobs(self) -> None:
+        """Print ready jobs one at a time until none are left."""
+        while True:
+            # Drop jobs cancelled since they were queued
+            while self._ready and self._ready[0].status != JobStatus.QUEUED:
+                self._ready.popleft()
 
-                try:
-                    logger.info(f"Processing job {job.job.id}")
-                    result = await self._print_handler(job.job)
+            if not self._ready:
+                # Nothing ready (offline jobs wait for the printer)
+                return
+
+            next_job = self._ready.popleft()
+            self._ready_count -= 1
+            self._current_job = next_job
+            self._current_job.status = JobStatus.PRINTING
+            self._current_job.set_started(datetime.now())
 
-                    job.result = result
-                    job.completed_at = datetime.now()
+            job = self._current_job
 
-                    if result.success:
-                        job.status = JobStatus.COMPLETED
-                        logger.info(f"Job {job.job.id} completed successfully")
-                    else:
-                        job.status = JobStatus.FAILED
-                        job.error = result.message
-                        logger.warning(f"Job {job.job.id} failed: {result.message}")
+            try:
+                logger.info(f"Processing job {job.job.id}")
+                result = await self._print_handler(job.job)
 
-                except Exception as e:
+                job.result = result
+                job.set_completed(datetime.now())
+
+                if result.success:
+                    job.status = JobStatus.COMPLETED
+                    logger.info(f"Job {job.job.id} completed successfully")
+                else:
                     job.status = JobStatus.FAILED
-                    job.error = str(e)
-                    job.completed_at = datetime.now()
-                    logger.error(f"Job {job.job.id} failed with exception: {e}")
+                    job.error = result.message
+                    logger.warning(f"Job {job.job.id} failed: {result.message}")
 
-                finally:
-                    self._history.append(job)
-                    self._current_job = None
+            except Exception as e:
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                job.set_completed(datetime.now())
+                logger.error(f"Job {job.job.id} failed with exception: {e}")
 
-        except Exception as e:
-            logger.error(f"Queue processing error: {e}")
-            self._processing = False
+            finally:
+                self._archive(job)
+                self._current_job = None
 
     def get_status(self) -> dict:
         """Get queue status."""
-        offline_count = sum(1 for j in self._queue if j.status == JobStatus.QUEUED_OFFLINE)
         return {
             "printer_id": self.printer_id,
-            "queued": len(self._queue),
-            "queued_offline": offline_count,
+            "queued": self._pending_count,
+            "queued_offline": self._offline_count,
             "processing": self._current_job is not None,
             "current_job": self._current_job.job.id if self._current_job else None,
             "printer_online": self._printer_online,
         }
 
     def get_queue(self) -> list[dict]:
-        """Get list of queued jobs."""
+        """Get list of queued jobs, in the order they will print."""
         jobs = []
 
         if self._current_job:
-            jobs.append(_job_to_dict(self._current_job))
+            jobs.append(self._current_job.to_dict())
+
+        for queued in self._ready:
+            if queued.status == JobStatus.QUEUED:
+                jobs.append(queued.to_dict())
 
-        for queued in self._queue:
-            jobs.append(_job_to_dict(queued))
+        for queued in self._offline:
+            if queued.status == JobStatus.QUEUED_OFFLINE:
+                jobs.append(queued.to_dict())
 
         return jobs
 
     def get_history(self, limit: int = 10) -> list[dict]:
-        """Get recent job history."""
-        return [_job_to_dict(j) for j in list(self._history)[-limit:]]
+        """Get recent job history, oldest first."""
+        # Walk back from the newest job instead of copying the whole deque
+        recent = [j.to_dict() for j in itertools.islice(reversed(self._history), max(limit, 0))]
+        recent.reverse()
+        return recent
 
     def get_job(self, job_id: str) -> Optional[QueuedJob]:
         """Get a specific job by ID."""
-        if self._current_job and self._current_job.job.id == job_id:
-            return self._current_job
-
-        for queued in self._queue:
-            if queued.job.id == job_id:
-                return queued
-
-        for completed in self._history:
-            if completed.job.id == job_id:
-                return completed
-
-        return None
+        return self._jobs_by_id.get(job_id)
 
     async def cancel(self, job_id: str) -> bool:
         """Cancel a queued job (cannot cancel if already printing)."""
-        async with self._lock:
-            for queued in self._queue:
-                if queued.job.id == job_id:
-                    queued.status = JobStatus.CANCELLED
-                    queued.completed_at = datetime.now()
-                    self._queue.remove(queued)
-                    self._history.append(queued)
-                    logger.info(f"Job {job_id} cancelled")
-                    return True
-
-        return False
+        queued = self._jobs_by_id.get(job_id)
+        if queued is None:
+            return False
+
+        status = queued.status
+        if status == JobStatus.QUEUED:
+            self._ready_count -= 1
+            pending, live_count = self._ready, self._ready_count
+        elif status == JobStatus.QUEUED_OFFLINE:
+            self._offline_count -= 1
+            pending, live_count = self._offline, self._offline_count
+        else:
+            return False
+
+        queued.status = JobStatus.CANCELLED
+        queued.set_completed(datetime.now())
+        self._archive(queued)
+        self._compact(pending, status, live_count)
+        logger.info(f"Job {job_id} cancelled")
+        return True
 
 
 class QueueFullError(Exception):
@@ -311,19 +450,4 @@ class QueueFullError(Exception):
 
 def _job_to_dict(queued: QueuedJob) -> dict:
     """Convert QueuedJob to API response dict."""
-    result = {
-        "id": queued.job.id,
-        "printer_id": queued.job.printer_id,
-        "filename": queued.job.filename,
-        "status": queued.status.value,
-        "queued_at": queued.queued_at.isoformat(),
-        "started_at": queued.started_at.isoformat() if queued.started_at else None,
-        "completed_at": queued.completed_at.isoformat() if queued.completed_at else None,
-        "error": queued.error,
-    }
-
-    # Include expiration for offline jobs
-    if queued.expires_at:
-        result["expires_at"] = queued.expires_at.isoformat()
-
-    return result
+    return queued.to_dict()
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteConfig:
     printer_id: str
     description: str = ""
@@ -35,12 +35,18 @@ class PrintRouter:
 
     def __init__(self):
         self._routes: dict[str, RouteConfig] = {}
+        # Flat intent -> printer_id map for the per-request resolve() path
+        self._printer_by_intent: dict[str, str] = {}
         self._default_label_printer: Optional[str] = None
         self._default_document_printer: Optional[str] = None
+        self._intents_cache: Optional[dict[str, dict]] = None
+        self._fallback_by_type: dict[str, str] = {}
+        self._build_fallbacks()
 
     def load_config(self, config: dict) -> None:
         """Load routing configuration."""
         routing = config.get("routing", {})
+        self._intents_cache = None
 
         for intent, target in routing.items():
             if isinstance(target, str):
@@ -53,10 +59,25 @@ class PrintRouter:
                     description=target.get("description", "")
                 )
 
+        self._printer_by_intent = {
+            intent: route.printer_id for intent, route in self._routes.items()
+        }
+
         # Set defaults
         defaults = config.get("defaults", {})
         self._default_label_printer = defaults.get("label_printer", "label")
         self._default_document_printer = defaults.get("document_printer", "document")
+        self._build_fallbacks()
+
+    def _build_fallbacks(self) -> None:
+        """
+        Precompute the content-type fallback printers. Keys are an exact
+        type or a major type ("image" covers every image/* type).
+        """
+        self._fallback_by_type = {
+            "image": self._default_label_printer or "label",
+            "application/pdf": self._default_document_printer or "document",
+        }
 
     def resolve(self, intent: str) -> Optional[str]:
         """
@@ -64,8 +85,7 @@ class PrintRouter:
 
         Returns None if intent not found.
         """
-        route = self._routes.get(intent)
-        return route.printer_id if route else None
+        return self._printer_by_intent.get(intent)
 
     def resolve_or_default(self, intent: str, content_type: str) -> str:
         """
@@ -75,24 +95,32 @@ class PrintRouter:
         if resolved:
             return resolved
 
-        # Fall back based on content type
-        if content_type.startswith("image/"):
-            return self._default_label_printer or "label"
-        elif content_type == "application/pdf":
-            return self._default_document_printer or "document"
+        # Fall back based on content type, exact match first
+        fallback = self._fallback_by_type.get(content_type)
+        if fallback is None:
+            major, sep, _ = content_type.partition("/")
+            fallback = self._fallback_by_type.get(major) if sep else None
 
-        return "label"  # Ultimate fallback
+        return fallback or "label"  # Ultimate fallback
 
     def list_intents(self) -> dict[str, dict]:
-        """List all configured intents for API discovery."""
-        return {
-            intent: {
-                "printer_id": route.printer_id,
-                "description": route.description
+        """
+        List all configured intents for API discovery.
+
+        Built once and cached until the routes change - treat as read-only.
+        """
+        if self._intents_cache is None:
+            self._intents_cache = {
+                intent: {
+                    "printer_id": route.printer_id,
+                    "description": route.description
+                }
+                for intent, route in self._routes.items()
             }
-            for intent, route in self._routes.items()
-        }
+        return self._intents_cache
 
     def add_route(self, intent: str, printer_id: str, description: str = "") -> None:
         """Programmatically add a route (useful for testing)."""
         self._routes[intent] = RouteConfig(printer_id=printer_id, description=description)
+        self._printer_by_intent[intent] = printer_id
+        self._intents_cache = None
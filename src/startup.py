@@ -4,6 +4,9 @@ Startup checks and validation.
 Run before starting the server to catch configuration issues early.
 """
 
+import errno
+import functools
+import importlib.util
 import logging
 import socket
 import sys
@@ -17,6 +20,25 @@ class StartupError(Exception):
     pass
 
 
+# Bind errors with a friendlier explanation, keyed by errno. The errno
+# module gives the local platform's codes (EADDRINUSE is 98 on Linux, 48
+# on macOS); the 100xx values are the Windows WSA equivalents.
+_BIND_ERRORS = {
+    **dict.fromkeys(
+        (errno.EADDRINUSE, 10048),
+        "Port {port} is already in use. Another service may be running on this port."
+    ),
+    **dict.fromkeys(
+        (errno.EADDRNOTAVAIL, 10049),
+        "Cannot bind to {host}:{port}. Check if the host address is valid."
+    ),
+    **dict.fromkeys(
+        (errno.EACCES, 10013),
+        "Permission denied for port {port}. Ports below 1024 require admin/root privileges."
+    ),
+}
+
+
 def check_port_available(host: str, port: int) -> tuple[bool, Optional[str]]:
     """
     Check if a port is available for binding.
@@ -25,22 +47,35 @@ def check_port_available(host: str, port: int) -> tuple[bool, Optional[str]]:
         (True, None) if available
         (False, error_message) if not
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        sock.bind((host, port))
-        sock.close()
-        return True, None
-    except socket.error as e:
-        if e.errno == 10048 or e.errno == 98:  # Windows / Linux "address in use"
-            return False, f"Port {port} is already in use. Another service may be running on this port."
-        elif e.errno == 10049 or e.errno == 99:  # Can't assign address
-            return False, f"Cannot bind to {host}:{port}. Check if the host address is valid."
-        elif e.errno == 10013 or e.errno == 13:  # Permission denied
-            return False, f"Permission denied for port {port}. Ports below 1024 require admin/root privileges."
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Bind the way uvicorn will, so a port left in TIME_WAIT by the
+        # previous run isn't reported as taken. On Windows SO_REUSEADDR
+        # would let us bind over a live listener, so ask for exclusive
+        # use there instead.
+        if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
         else:
-            return False, f"Cannot bind to {host}:{port}: {e}"
-    finally:
-        sock.close()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError as e:
+            message = _BIND_ERRORS.get(e.errno, "Cannot bind to {host}:{port}: {error}")
+            return False, message.format(host=host, port=port, error=e)
+        return True, None
+
+
+def _normalize_routing(routing: dict) -> dict[str, Optional[str]]:
+    """
+    Map each intent to its printer ID, accepting both routing formats
+    (intent: printer_id and intent: {printer: ..., description: ...}).
+    Targets in neither format map to None.
+    """
+    return {
+        intent: target if isinstance(target, str)
+        else target.get("printer") if isinstance(target, dict)
+        else None
+        for intent, target in routing.items()
+    }
 
 
 def validate_config(config: dict) -> list[str]:
@@ -82,46 +117,38 @@ def validate_config(config: dict) -> list[str]:
             issues.append(f"Printer '{pid}' has no 'adapter' field.")
 
     # Check routing config
-    routing = config.get("routing", {})
-    for intent, target in routing.items():
-        printer_id = target if isinstance(target, str) else target.get("printer")
-        if printer_id and printer_id not in printer_ids and printers:
-            issues.append(f"Intent '{intent}' routes to unknown printer '{printer_id}'.")
+    if printers:
+        for intent, printer_id in _normalize_routing(config.get("routing") or {}).items():
+            if printer_id and printer_id not in printer_ids:
+                issues.append(f"Intent '{intent}' routes to unknown printer '{printer_id}'.")
 
     return issues
 
 
+# Optional dependencies: display name -> importable module
+OPTIONAL_DEPENDENCIES = (
+    ("brother_ql", "brother_ql"),  # Label printing
+    ("pycups", "cups"),  # CUPS printing
+    ("pypdf", "pypdf"),  # PDF validation
+)
+
+
+@functools.cache
 def check_dependencies() -> dict[str, bool]:
     """
     Check which optional dependencies are available.
 
+    Uses importlib.util.find_spec, so the modules are located but not
+    imported (adapters import them only when configured). The result is
+    computed once - treat it as read-only.
+
     Returns:
         Dict of dependency name -> is_available
     """
-    deps = {}
-
-    # brother_ql for label printing
-    try:
-        import brother_ql
-        deps["brother_ql"] = True
-    except ImportError:
-        deps["brother_ql"] = False
-
-    # pycups for CUPS printing
-    try:
-        import cups
-        deps["pycups"] = True
-    except ImportError:
-        deps["pycups"] = False
-
-    # pypdf for PDF validation
-    try:
-        import pypdf
-        deps["pypdf"] = True
-    except ImportError:
-        deps["pypdf"] = False
-
-    return deps
+    return {
+        name: importlib.util.find_spec(module) is not None
+        for name, module in OPTIONAL_DEPENDENCIES
+    }
 
 
 def run_startup_checks(config: dict) -> None:
@@ -190,33 +217,37 @@ def print_startup_banner(config: dict, printers: list) -> None:
     host = server.get("host", "0.0.0.0")
     port = server.get("port", 5001)
 
-    # Get local IP for convenience
+    # Get local IP for convenience. Connecting a UDP socket sends nothing;
+    # it only asks the kernel which interface would route to that address.
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-    except Exception:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+    except OSError:
         local_ip = "unknown"
 
-    print("")
-    print("=" * 50)
-    print("  Print Gateway Server")
-    print("=" * 50)
-    print("")
-    print(f"  Local URL:    http://localhost:{port}")
-    print(f"  Network URL:  http://{local_ip}:{port}")
-    print(f"  API Docs:     http://localhost:{port}/docs")
-    print("")
-    print("  Printers:")
-    for printer in printers:
-        print(f"    • {printer.name} ({printer.printer_id})")
-    print("")
-    print("  Endpoints:")
-    print("    POST /v1/print?intent=<intent>  - Print with routing")
-    print("    GET  /v1/intents                - List intents")
-    print("    GET  /v1/health                 - Health check")
-    print("    GET  /v1/status                 - Printer status")
-    print("")
-    print("=" * 50)
-    print("")
+    # Written in one go so uvicorn's log output can't interleave with it
+    lines = [
+        "",
+        "=" * 50,
+        "  Print Gateway Server",
+        "=" * 50,
+        "",
+        f"  Local URL:    http://localhost:{port}",
+        f"  Network URL:  http://{local_ip}:{port}",
+        f"  API Docs:     http://localhost:{port}/docs",
+        "",
+        "  Printers:",
+        *(f"    • {printer.name} ({printer.printer_id})" for printer in printers),
+        "",
+        "  Endpoints:",
+        "    POST /v1/print?intent=<intent>  - Print with routing",
+        "    GET  /v1/intents                - List intents",
+        "    GET  /v1/health                 - Health check",
+        "    GET  /v1/status                 - Printer status",
+        "",
+        "=" * 50,
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
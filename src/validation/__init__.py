@@ -1,4 +1,5 @@
+from .cache import ValidationCache
 from .document import validate_pdf
 from .image import ImageValidationError, validate_label_image
 
-__all__ = ["validate_label_image", "ImageValidationError", "validate_pdf"]
+__all__ = ["validate_label_image", "ImageValidationError", "validate_pdf", "ValidationCache"]
@@ -0,0 +1,44 @@
+"""
+Result cache for upload validation.
+
+Print clients often retry by re-uploading the same file. Keying results on a
+SHA-256 of the payload turns the repeated PNG decode / PDF parse into a hash.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ValidationCache:
+    """
+    Bounded LRU of validation results keyed by validator and content hash.
+
+    Cached results are shared between callers and must not be mutated.
+    Safe to call from several threads; validators run outside the lock.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        self._results: OrderedDict[tuple[Callable, bytes], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, validator: Callable[[bytes], T], data: bytes) -> T:
+        """Return validator(data), reusing the result for identical data."""
+        key = (validator, hashlib.sha256(data).digest())
+
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return result
+
+        result = validator(data)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+        return result
@@ -5,8 +5,18 @@ Basic PDF validation - ensures the file is actually a PDF.
 """
 
 from dataclasses import dataclass
+from io import BytesIO
 from typing import Optional
 
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# Every PDF file starts with this header
+PDF_SIGNATURE = b"%PDF"
+
 
 @dataclass
 class DocumentValidationResult:
@@ -37,31 +47,25 @@ def validate_pdf(data: bytes) -> DocumentValidationResult:
         )
 
     # Check PDF magic bytes
-    if not data.startswith(b"%PDF"):
+    if not data.startswith(PDF_SIGNATURE):
         return DocumentValidationResult(
             valid=False,
             error="File does not appear to be a PDF",
             error_code="INVALID_FORMAT"
         )
 
-    # Optional: use pypdf for deeper validation
+    # Optional: use pypdf for deeper validation (skip page count without it)
     page_count = None
-    try:
-        from io import BytesIO
-
-        from pypdf import PdfReader
-
-        reader = PdfReader(BytesIO(data))
-        page_count = len(reader.pages)
-    except ImportError:
-        # pypdf not available, skip page count
-        pass
-    except Exception as e:
-        return DocumentValidationResult(
-            valid=False,
-            error=f"Invalid PDF: {e}",
-            error_code="CORRUPT_PDF"
-        )
+    if PYPDF_AVAILABLE:
+        try:
+            reader = PdfReader(BytesIO(data))
+            page_count = len(reader.pages)
+        except Exception as e:
+            return DocumentValidationResult(
+                valid=False,
+                error=f"Invalid PDF: {e}",
+                error_code="CORRUPT_PDF"
+            )
 
     return DocumentValidationResult(
         valid=True,
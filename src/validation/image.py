@@ -8,11 +8,15 @@ Per spec requirements:
 - Height is variable
 """
 
+import functools
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Optional
 
-from PIL import Image
+from PIL import Image, ImageChops
+
+# First 8 bytes of every PNG file
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 
 class ImageValidationError(Exception):
@@ -113,10 +117,59 @@ def validate_label_image(
     )
 
 
+# RGB(A) images with up to this many distinct colours are checked from
+# their colour list; above it they get the full mask scan
+_MAX_COLORS_CHECKED = 16
+
+# Rows per band when scanning pixel masks
+_SCAN_BAND_ROWS = 256
+
+
+@functools.lru_cache(maxsize=8)
+def _band_tables(tolerance: int) -> tuple[list[int], list[int]]:
+    """
+    point() lookup tables for one channel: 255 where the value counts as
+    black (<= tolerance) or as white (>= 255 - tolerance), else 0.
+    """
+    black = [255 if v <= tolerance else 0 for v in range(256)]
+    white = [255 if v >= 255 - tolerance else 0 for v in range(256)]
+    return black, white
+
+
+def _first_zero_pixel(mask: Image.Image) -> Optional[tuple[int, int]]:
+    """(x, y) of the first 0 pixel of an L mask in raster order, or None."""
+    bad = ImageChops.invert(mask)
+    bbox = bad.getbbox()
+    if bbox is None:
+        return None
+    y = bbox[1]
+    x = bad.crop((0, y, bad.width, y + 1)).getbbox()[0]
+    return x, y
+
+
+def _rgb_monochrome_mask(image: Image.Image, tolerance: int) -> Image.Image:
+    """L mask of an RGB(A) image: 255 where the pixel is black or white, else 0."""
+    black_table, white_table = _band_tables(tolerance)
+    r, g, b = image.split()[:3]
+    # Black/white only when all three channels agree
+    is_black = ImageChops.darker(
+        ImageChops.darker(r.point(black_table), g.point(black_table)), b.point(black_table)
+    )
+    is_white = ImageChops.darker(
+        ImageChops.darker(r.point(white_table), g.point(white_table)), b.point(white_table)
+    )
+    return ImageChops.lighter(is_black, is_white)
+
+
 def _check_monochrome(image: Image.Image, tolerance: int = 0) -> tuple[bool, str]:
     """
     Check if image is strictly black and white.
 
+    Works from Pillow's extrema and colour lists where they settle the
+    answer, and otherwise classifies pixels with point()/ImageChops
+    operations, so the scan runs in C rather than over a Python list of
+    every pixel.
+
     Returns:
         Tuple of (is_monochrome, error_message)
     """
@@ -127,32 +180,48 @@ def _check_monochrome(image: Image.Image, tolerance: int = 0) -> tuple[bool, str
 
     if image.mode in ("L", "LA"):
         # Grayscale - check for values other than 0 and 255
-        pixels = list(image.getdata())
-        if image.mode == "LA":
-            pixels = [p[0] for p in pixels]  # Extract luminance from LA
-
-        for pixel in pixels:
-            if tolerance == 0:
-                if pixel not in (0, 255):
-                    return False, f"Image contains grayscale values (found {pixel})"
-            else:
-                if not (pixel <= tolerance or pixel >= 255 - tolerance):
-                    return False, f"Image contains grayscale values (found {pixel})"
+        lum = image.getchannel(0)  # Luminance (drops alpha from LA)
+
+        # The extrema alone settle most images: a min or max outside both
+        # bands is a gray value, and an image inside one band is uniform
+        low, high = lum.getextrema()
+        for value in (low, high):
+            if tolerance < value < 255 - tolerance:
+                return False, f"Image contains grayscale values (found {value})"
+        if high <= tolerance or low >= 255 - tolerance:
+            return True, ""
+
+        # One channel has at most 256 values, so getcolors() is a complete
+        # histogram here and no per-pixel scan is needed
+        for _, value in lum.getcolors(maxcolors=256):
+            if tolerance < value < 255 - tolerance:
+                return False, f"Image contains grayscale values (found {value})"
         return True, ""
 
     if image.mode in ("RGB", "RGBA"):
-        pixels = list(image.getdata())
-
-        for pixel in pixels:
-            r, g, b = pixel[:3]
-            if tolerance == 0:
-                is_black = (r == 0 and g == 0 and b == 0)
-                is_white = (r == 255 and g == 255 and b == 255)
-            else:
-                is_black = (r <= tolerance and g <= tolerance and b <= tolerance)
-                is_white = (r >= 255 - tolerance and g >= 255 - tolerance and b >= 255 - tolerance)
-
-            if not (is_black or is_white):
+        # All-black or all-white images pass on their channel extrema alone
+        extrema = image.getextrema()[:3]
+        if (all(high <= tolerance for _, high in extrema)
+                or all(low >= 255 - tolerance for low, _ in extrema)):
+            return True, ""
+
+        # Images with only a few distinct colours are settled from
+        # getcolors(), which gives up as soon as there are more
+        colors = image.getcolors(maxcolors=_MAX_COLORS_CHECKED)
+        if colors is not None:
+            for _, color in colors:
+                r, g, b = color[:3]
+                if not (max(r, g, b) <= tolerance or min(r, g, b) >= 255 - tolerance):
+                    return False, f"Image contains non-monochrome pixels (found RGB {r},{g},{b})"
+            return True, ""
+
+        # Scan in bands of rows so a bad pixel near the top of a tall
+        # label is reported without classifying the rest of the image
+        for top in range(0, image.height, _SCAN_BAND_ROWS):
+            band = image.crop((0, top, image.width, min(top + _SCAN_BAND_ROWS, image.height)))
+            pos = _first_zero_pixel(_rgb_monochrome_mask(band, tolerance))
+            if pos is not None:
+                r, g, b = band.getpixel(pos)[:3]
                 return False, f"Image contains non-monochrome pixels (found RGB {r},{g},{b})"
 
         return True, ""
@@ -1,12 +1,14 @@
 """Tests for API endpoints."""
 
+import functools
+
 import pytest
 from io import BytesIO
 from PIL import Image
 from fastapi.testclient import TestClient
 
 from src.api.server import create_app
-from src.printers import PrinterRegistry
+from src.printers import PrinterRegistry, PrinterStatus
 from src.printers.mock import MockLabelPrinter, MockDocumentPrinter
 
 
@@ -42,8 +44,9 @@ def client(test_registry, test_routing_config):
     return TestClient(app)
 
 
+@functools.cache
 def create_test_png(width: int = 720, height: int = 100) -> bytes:
-    """Create a valid test PNG."""
+    """Create a valid test PNG (encoded once per size)."""
     img = Image.new("1", (width, height), 0)
     buffer = BytesIO()
     img.save(buffer, format="PNG")
@@ -58,6 +61,47 @@ class TestHealthEndpoint:
         assert response.json() == {"status": "ok"}
 
 
+class TestPrinterRegistry:
+    @pytest.mark.asyncio
+    async def test_get_all_status_reports_failed_probe_as_offline(self, test_registry):
+        """A printer whose probe raises should not hide the others."""
+        class BrokenPrinter(MockLabelPrinter):
+            async def get_status(self) -> PrinterStatus:
+                raise RuntimeError("probe failed")
+
+        test_registry.register(BrokenPrinter("broken", "Broken Printer"))
+
+        statuses = await test_registry.get_all_status()
+
+        assert statuses == {
+            "label": PrinterStatus.READY,
+            "document": PrinterStatus.READY,
+            "broken": PrinterStatus.OFFLINE,
+        }
+
+
+class TestStatusCache:
+    @pytest.mark.asyncio
+    async def test_cached_status_reuses_recent_probe(self):
+        """Back-to-back cached reads should probe the device once."""
+        probes = []
+
+        class CountingPrinter(MockLabelPrinter):
+            async def get_status(self) -> PrinterStatus:
+                probes.append(1)
+                return await super().get_status()
+
+        printer = CountingPrinter("label", "Counting Printer")
+
+        assert await printer.get_cached_status() == PrinterStatus.READY
+        assert await printer.get_cached_status() == PrinterStatus.READY
+        assert len(probes) == 1
+
+        printer.set_status(PrinterStatus.OFFLINE)
+        assert await printer.get_cached_status() == PrinterStatus.OFFLINE
+        assert len(probes) == 2
+
+
 class TestStatusEndpoint:
     def test_get_status(self, client):
         """Status should list all printers."""
@@ -97,6 +141,16 @@ class TestLabelPrinting:
         data = response.json()
         assert data["code"] == "INVALID_WIDTH"
 
+    def test_print_non_png_rejected_before_decode(self, client):
+        """Data without a PNG signature should fail the format check."""
+        response = client.post(
+            "/v1/print/label",
+            files={"file": ("test.png", b"GIF89a not really a png", "image/png")}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_FORMAT"
+
     def test_print_to_unknown_printer(self, client):
         """Unknown printer should return 404."""
         png_data = create_test_png()
@@ -109,6 +163,64 @@ class TestLabelPrinting:
         assert response.status_code == 404
 
 
+class TestUploadLimits:
+    def test_oversized_body_rejected(self, test_registry, test_routing_config):
+        """Bodies over max_upload_bytes should get 413 before reaching the route."""
+        app = create_app(test_registry, routing_config=test_routing_config, max_upload_bytes=1024)
+        small_client = TestClient(app)
+
+        response = small_client.post(
+            "/v1/print/label",
+            files={"file": ("test.png", create_test_png(), "image/png")}
+        )
+        assert response.status_code == 200
+
+        response = small_client.post(
+            "/v1/print/label",
+            files={"file": ("big.png", b"x" * 4096, "image/png")}
+        )
+        assert response.status_code == 413
+
+    def test_chunked_body_counted(self, test_registry, test_routing_config):
+        """Bodies without Content-Length should be cut off at the limit."""
+        app = create_app(test_registry, routing_config=test_routing_config, max_upload_bytes=1024)
+        small_client = TestClient(app)
+
+        def body():
+            for _ in range(8):
+                yield b"x" * 512
+
+        response = small_client.post(
+            "/v1/print/label",
+            content=body(),
+            headers={"content-type": "multipart/form-data; boundary=xyz"}
+        )
+        assert response.status_code == 413
+
+    def test_label_endpoint_limit(self, client, monkeypatch):
+        """Label uploads over the label limit should get 413."""
+        from src.api import routes
+        monkeypatch.setattr(routes, "MAX_LABEL_UPLOAD_BYTES", 10)
+
+        response = client.post(
+            "/v1/print/label",
+            files={"file": ("test.png", create_test_png(), "image/png")}
+        )
+        assert response.status_code == 413
+
+    def test_wrong_signature_rejected_before_full_read(self, client, monkeypatch):
+        """A non-PDF should fail on its first chunk, before the size limit is hit."""
+        from src.api import routes
+        monkeypatch.setattr(routes, "MAX_DOCUMENT_UPLOAD_BYTES", 10)
+
+        response = client.post(
+            "/v1/print/document",
+            files={"file": ("test.pdf", b"not a pdf" * 100, "application/pdf")}
+        )
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_FORMAT"
+
+
 class TestDocumentPrinting:
     def test_print_valid_pdf(self, client):
         """Valid PDF should be accepted."""
@@ -172,6 +284,27 @@ class TestQueueEndpoint:
         assert data["printer_id"] == "label"
 
 
+class TestJobEndpoint:
+    def test_get_job(self, client):
+        """Submitted job should be retrievable by ID."""
+        response = client.post(
+            "/v1/print/label",
+            files={"file": ("test.png", create_test_png(), "image/png")}
+        )
+        job_id = response.json()["job_id"]
+
+        response = client.get(f"/v1/job/{job_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == job_id
+        assert data["printer_id"] == "label"
+
+    def test_get_unknown_job(self, client):
+        """Unknown job ID should return 404."""
+        assert client.get("/v1/job/nonexistent").status_code == 404
+        assert client.delete("/v1/job/nonexistent").status_code == 404
+
+
 class TestIntentRouting:
     def test_list_intents(self, client):
         """Should list configured intents."""
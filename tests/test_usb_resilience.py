@@ -25,37 +25,22 @@ from src.queue.manager import PrintQueue, QueuedJob, JobStatus, QueueFullError
 class TestUSBErrorClassification:
     """Tests for USB error classification."""
 
-    def test_errno_5_is_recoverable(self):
-        """Errno 5 (I/O error) should be recoverable."""
-        error = OSError(5, "Input/output error")
-        assert classify_usb_error(error) == USBErrorType.RECOVERABLE
-        assert is_recoverable_error(error)
-
-    def test_errno_19_is_recoverable(self):
-        """Errno 19 (no such device) should be recoverable."""
-        error = OSError(19, "No such device")
-        assert classify_usb_error(error) == USBErrorType.RECOVERABLE
-
-    def test_errno_110_is_recoverable(self):
-        """Errno 110 (connection timed out) should be recoverable."""
-        error = OSError(110, "Connection timed out")
-        assert classify_usb_error(error) == USBErrorType.RECOVERABLE
-
-    def test_device_not_found_message_is_recoverable(self):
-        """Error message containing 'device not found' should be recoverable."""
-        error = Exception("USB device not found")
-        assert classify_usb_error(error) == USBErrorType.RECOVERABLE
-
-    def test_io_error_message_is_recoverable(self):
-        """Error message containing 'i/o error' should be recoverable."""
-        error = Exception("USB I/O error occurred")
-        assert classify_usb_error(error) == USBErrorType.RECOVERABLE
-
-    def test_generic_error_is_unknown(self):
-        """Generic errors without USB indicators should be unknown."""
-        error = ValueError("Some validation error")
-        assert classify_usb_error(error) == USBErrorType.UNKNOWN
-        assert not is_recoverable_error(error)
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (OSError(5, "Input/output error"), USBErrorType.RECOVERABLE),
+            (OSError(19, "No such device"), USBErrorType.RECOVERABLE),
+            (OSError(110, "Connection timed out"), USBErrorType.RECOVERABLE),
+            (Exception("USB device not found"), USBErrorType.RECOVERABLE),
+            (Exception("USB I/O error occurred"), USBErrorType.RECOVERABLE),
+            (ValueError("Some validation error"), USBErrorType.UNKNOWN),
+        ],
+        ids=["errno_5", "errno_19", "errno_110", "device_not_found", "io_error", "generic"],
+    )
+    def test_classification(self, error, expected):
+        """Errors should be classified by errno or message."""
+        assert classify_usb_error(error) == expected
+        assert is_recoverable_error(error) == (expected is USBErrorType.RECOVERABLE)
 
     def test_nested_exception_is_checked(self):
         """Nested exceptions with USB errors should be recoverable."""
@@ -64,6 +49,24 @@ class TestUSBErrorClassification:
         outer.__cause__ = inner
         assert classify_usb_error(outer) == USBErrorType.RECOVERABLE
 
+    def test_implicit_context_is_checked(self):
+        """An error raised while handling a USB error should be recoverable."""
+        try:
+            try:
+                raise OSError(19, "No such device")
+            except OSError:
+                raise RuntimeError("Print failed")
+        except RuntimeError as e:
+            assert classify_usb_error(e) == USBErrorType.RECOVERABLE
+
+    def test_cause_cycle_terminates(self):
+        """A cause chain that loops back on itself should not hang."""
+        first = ValueError("first")
+        second = ValueError("second")
+        first.__cause__ = second
+        second.__cause__ = first
+        assert classify_usb_error(first) == USBErrorType.UNKNOWN
+
 
 class TestResilienceConfig:
     """Tests for ResilienceConfig dataclass."""
@@ -96,6 +99,13 @@ class TestResilienceConfig:
         assert config.retry_delay_ms == 2000
         assert config.offline_queue_enabled is False
 
+    def test_health_check_interval_is_clamped(self):
+        """Out-of-range health check intervals should be clamped."""
+        too_fast = ResilienceConfig.from_dict({"resilience": {"health_check_interval_sec": 0.001}})
+        too_slow = ResilienceConfig.from_dict({"resilience": {"health_check_interval_sec": 86400}})
+        assert too_fast.health_check_interval_sec == 1.0
+        assert too_slow.health_check_interval_sec == 3600.0
+
     def test_from_dict_with_empty_dict(self):
         """Test loading config from empty dict uses defaults."""
         config = ResilienceConfig.from_dict({})
@@ -107,6 +117,18 @@ class TestResilienceConfig:
         config = ResilienceConfig(retry_delay_ms=2500)
         assert config.retry_delay_sec == 2.5
 
+    def test_backoff_doubles_up_to_cap(self):
+        """Retry delays should grow exponentially and stop at the cap."""
+        config = ResilienceConfig(retry_delay_ms=500, backoff_max_ms=3000, jitter=0.0)
+        delays = [config.backoff_delay_sec(attempt) for attempt in range(5)]
+        assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    def test_backoff_jitter_stays_in_range(self):
+        """Jitter should keep each delay within +/- the configured fraction."""
+        config = ResilienceConfig(backoff_base_ms=1000, jitter=0.2)
+        for _ in range(100):
+            assert 0.8 <= config.backoff_delay_sec(0) <= 1.2
+
 
 class TestUSBDeviceState:
     """Tests for USBDeviceState dataclass."""
@@ -121,6 +143,102 @@ class TestUSBDeviceState:
         assert state.reconnect_attempts == 0
 
 
+class TestDiscoverCache:
+    """Tests for the shared brother_ql discover() cache."""
+
+    @pytest.mark.asyncio
+    async def test_discover_reused_until_invalidated(self, monkeypatch):
+        """Back-to-back probes should share one USB enumeration."""
+        from src.printers import brother_ql_adapter
+
+        calls = []
+
+        def fake_discover(backend_identifier):
+            calls.append(backend_identifier)
+            return [{"identifier": "usb://0x04f9:0x2044"}]
+
+        monkeypatch.setattr(brother_ql_adapter, "discover", fake_discover, raising=False)
+        brother_ql_adapter._invalidate_discover_cache()
+
+        await brother_ql_adapter._cached_discover("pyusb")
+        await brother_ql_adapter._cached_discover("pyusb")
+        assert calls == ["pyusb"]
+
+        brother_ql_adapter._invalidate_discover_cache()
+        await brother_ql_adapter._cached_discover("pyusb")
+        assert calls == ["pyusb", "pyusb"]
+        brother_ql_adapter._invalidate_discover_cache()
+
+
+class TestDeviceMatching:
+    """Tests for matching discovered USB identifiers to the configured device."""
+
+    def test_serial_suffix_and_hex_case(self):
+        """Appended serials and upper-case hex IDs should still match."""
+        from src.printers.brother_ql_adapter import BrotherQLAdapter
+
+        adapter = BrotherQLAdapter("label", "Label", {"device": "usb://0x04F9:0x2044"})
+        assert adapter._matches_device("usb://0x04F9:0x2044")
+        assert adapter._matches_device("usb://0x04f9:0x2044/000A1B2C3D")
+        assert not adapter._matches_device("usb://0x04f9:0x2042")
+
+    def test_non_usb_device_needs_exact_match(self):
+        """Device files are only matched exactly."""
+        from src.printers.brother_ql_adapter import BrotherQLAdapter
+
+        adapter = BrotherQLAdapter("label", "Label", {"device": "/dev/usb/lp0"})
+        assert adapter._matches_device("/dev/usb/lp0")
+        assert not adapter._matches_device("/dev/usb/lp01")
+
+
+class TestUSBPrintWorker:
+    """Tests for the persistent USB send worker."""
+
+    @pytest.mark.asyncio
+    async def test_handle_reused_and_reopened_after_error(self, monkeypatch):
+        """Jobs should share one open handle until a send fails."""
+        from src.printers import brother_ql_adapter
+
+        opened = []
+
+        class FakeBackend:
+            def __init__(self, device):
+                opened.append(device)
+                self._responses = []
+
+            def write(self, data):
+                if data == b"fail":
+                    raise OSError(5, "Input/output error")
+                self._responses = [b"done", b"ready"]
+
+            def read(self):
+                return self._responses.pop(0) if self._responses else b""
+
+            def dispose(self):
+                pass
+
+        def fake_interpret(data):
+            if data == b"done":
+                return {"errors": [], "status_type": "Printing completed", "phase_type": None}
+            return {"errors": [], "status_type": "Phase change", "phase_type": "Waiting to receive"}
+
+        monkeypatch.setattr(brother_ql_adapter, "BrotherQLBackendPyUSB", FakeBackend, raising=False)
+        monkeypatch.setattr(brother_ql_adapter, "interpret_response", fake_interpret, raising=False)
+
+        worker = brother_ql_adapter._USBPrintWorker("test-worker")
+        device = "usb://0x04f9:0x2044"
+
+        status = await asyncio.wrap_future(worker.submit(device, b"job1"))
+        assert status["outcome"] == "printed"
+        await asyncio.wrap_future(worker.submit(device, b"job2"))
+        assert opened == [device]
+
+        with pytest.raises(OSError):
+            await asyncio.wrap_future(worker.submit(device, b"fail"))
+        await asyncio.wrap_future(worker.submit(device, b"job3"))
+        assert opened == [device, device]
+
+
 class TestOfflineQueue:
     """Tests for offline queue functionality."""
 
@@ -161,6 +279,19 @@ class TestOfflineQueue:
         assert queued.expires_at >= expected_min
         assert queued.expires_at <= expected_max
 
+    @pytest.mark.asyncio
+    async def test_offline_job_expires_on_time(self, mock_print_handler):
+        """Offline jobs should expire at their deadline, not on the next poll."""
+        queue = PrintQueue("test", mock_print_handler, offline_queue_timeout_sec=0.05)
+        job = PrintJob(printer_id="test", filename="test.png", data=b"test")
+
+        queued = await queue.add_offline(job)
+        await asyncio.sleep(0.2)
+
+        assert queued.status == JobStatus.EXPIRED
+        assert queue.get_status()["queued_offline"] == 0
+        assert queue._expiry_task.done()
+
     @pytest.mark.asyncio
     async def test_on_printer_online_promotes_offline_jobs(self, mock_print_handler):
         """Test that on_printer_online promotes QUEUED_OFFLINE to QUEUED."""
@@ -203,9 +334,11 @@ class TestOfflineQueue:
     async def test_offline_jobs_not_processed_until_online(self, mock_print_handler):
         """Test that offline jobs are not processed until printer comes online."""
         processed = []
+        done = asyncio.Event()
 
         async def tracking_handler(job: PrintJob) -> PrintResult:
             processed.append(job.id)
+            done.set()
             return PrintResult(success=True, job_id=job.id, message="OK")
 
         queue = PrintQueue("test", tracking_handler, offline_queue_timeout_sec=600)
@@ -213,21 +346,124 @@ class TestOfflineQueue:
 
         await queue.add_offline(job)
 
-        # Give some time for any processing to occur
-        await asyncio.sleep(0.1)
-
-        # Job should not be processed yet
-        assert len(processed) == 0
+        # Job should not be processed while the printer is offline
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(done.wait(), timeout=0.05)
+        assert processed == []
 
         # Bring printer online
         await queue.on_printer_online()
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+
+        assert processed == [job.id]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_offline_job_is_not_printed(self):
+        """A cancelled offline job should stay cancelled after promotion."""
+        processed = []
+
+        async def tracking_handler(job: PrintJob) -> PrintResult:
+            processed.append(job.id)
+            return PrintResult(success=True, job_id=job.id, message="OK")
 
-        # Give time for processing
+        queue = PrintQueue("test", tracking_handler, offline_queue_timeout_sec=600)
+        cancelled = PrintJob(printer_id="test", filename="a.png", data=b"a")
+        kept = PrintJob(printer_id="test", filename="b.png", data=b"b")
+        await queue.add_offline(cancelled)
+        await queue.add_offline(kept)
+
+        assert await queue.cancel(cancelled.id)
+        assert queue.get_status()["queued_offline"] == 1
+        assert [j["id"] for j in queue.get_queue()] == [kept.id]
+
+        assert await queue.on_printer_online() == 1
         await asyncio.sleep(0.1)
 
-        # Now job should be processed
-        assert len(processed) == 1
-        assert job.id in processed
+        assert processed == [kept.id]
+        assert queue.get_job(cancelled.id).status == JobStatus.CANCELLED
+        assert not await queue.cancel(cancelled.id)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_jobs_do_not_accumulate(self, mock_print_handler):
+        """Repeated add+cancel should not grow the pending deques."""
+        queue = PrintQueue("test", mock_print_handler, max_queue_size=5)
+        live = PrintJob(printer_id="test", filename="live.png", data=b"live")
+        await queue.add_offline(live)
+
+        for i in range(2000):
+            job = PrintJob(printer_id="test", filename=f"{i}.png", data=b"x")
+            await queue.add_offline(job)
+            assert await queue.cancel(job.id)
+
+        assert queue.get_status()["queued_offline"] == 1
+        assert len(queue._offline) <= 3
+        assert [j["id"] for j in queue.get_queue()] == [live.id]
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_adds_print_one_at_a_time(self):
+        """Jobs added together should still be printed sequentially."""
+        active = 0
+        max_active = 0
+
+        async def handler(job: PrintJob) -> PrintResult:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return PrintResult(success=True, job_id=job.id, message="OK")
+
+        queue = PrintQueue("test", handler)
+        for i in range(3):
+            await queue.add(PrintJob(printer_id="test", filename=f"{i}.png", data=b"x"))
+        await asyncio.sleep(0.1)
+
+        assert max_active == 1
+        assert len(queue.get_history()) == 3
+
+    @pytest.mark.asyncio
+    async def test_processor_task_is_reused_until_closed(self, mock_print_handler):
+        """One processor task should serve every add until close()."""
+        queue = PrintQueue("test", mock_print_handler)
+        await queue.add(PrintJob(printer_id="test", filename="a.png", data=b"a"))
+        task = queue._processor_task
+        await asyncio.sleep(0.05)
+
+        await queue.add(PrintJob(printer_id="test", filename="b.png", data=b"b"))
+        await asyncio.sleep(0.05)
+        assert queue._processor_task is task
+        assert len(queue.get_history()) == 2
+
+        await queue.close()
+        assert task.cancelled()
+
+
+class TestJobIndexCallbacks:
+    """Tests for the job lifecycle callbacks used by QueueManager's index."""
+
+    @pytest.mark.asyncio
+    async def test_history_eviction_is_reported(self):
+        """Jobs dropping out of history should be reported as evicted."""
+        added: list[str] = []
+        evicted: list[str] = []
+
+        async def handler(job: PrintJob) -> PrintResult:
+            return PrintResult(success=True, job_id=job.id, message="OK")
+
+        queue = PrintQueue(
+            "test",
+            handler,
+            on_job_added=lambda pid, jid: added.append(jid),
+            on_job_evicted=lambda pid, jid: evicted.append(jid)
+        )
+        jobs = [PrintJob(printer_id="test", data=b"x") for _ in range(51)]
+        for job in jobs:
+            await queue.cancel((await queue.add(job)).job.id)
+
+        assert added == [job.id for job in jobs]
+        assert evicted == [jobs[0].id]
+        assert queue.get_job(jobs[0].id) is None
 
 
 class TestJobExpiration:
@@ -282,3 +518,95 @@ class TestJobStatus:
         assert "failed" in statuses
         assert "cancelled" in statuses
         assert "expired" in statuses
+
+
+class TestHealthMonitor:
+    """Tests for the background health monitor."""
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_does_not_block_others(self):
+        """One printer's probe raising should not hide the other printers."""
+        from src.health import HealthMonitor
+        from src.printers import PrinterRegistry, PrinterStatus
+        from src.printers.mock import MockLabelPrinter
+
+        class BrokenPrinter(MockLabelPrinter):
+            async def get_status(self):
+                raise OSError("usb gone")
+
+        registry = PrinterRegistry()
+        registry.register(BrokenPrinter("broken", "Broken"))
+        registry.register(MockLabelPrinter("label", "Label"))
+
+        monitor = HealthMonitor(registry)
+        statuses = await monitor.check_now()
+
+        assert statuses == {"label": PrinterStatus.READY}
+        assert monitor.get_last_status("broken") is None
+
+    @pytest.mark.asyncio
+    async def test_stop_wakes_sleeping_monitor(self):
+        """stop() should return promptly even with a long interval."""
+        from src.health import HealthMonitor
+        from src.printers import PrinterRegistry
+        from src.printers.mock import MockLabelPrinter
+
+        registry = PrinterRegistry()
+        registry.register(MockLabelPrinter("label", "Label"))
+
+        monitor = HealthMonitor(registry, default_interval_sec=3600)
+        await monitor.start()
+        await asyncio.sleep(0)
+        await asyncio.wait_for(monitor.stop(), timeout=1)
+
+        assert not monitor.is_running
+
+    @pytest.mark.asyncio
+    async def test_interval_backs_off_and_resets_on_change(self):
+        """Stable printers back off; a status change re-polls quickly."""
+        from src.health import HealthMonitor
+        from src.printers import PrinterRegistry, PrinterStatus
+        from src.printers.mock import MockLabelPrinter
+
+        printer = MockLabelPrinter("label", "Label")
+        registry = PrinterRegistry()
+        registry.register(printer)
+
+        monitor = HealthMonitor(registry, default_interval_sec=8, min_interval_sec=1)
+        await monitor.check_now()
+        assert monitor._interval["label"] == 8
+
+        printer.set_status(PrinterStatus.OFFLINE)
+        await monitor.check_now()
+        assert monitor._interval["label"] == 1
+
+        await monitor.check_now()
+        await monitor.check_now()
+        assert monitor._interval["label"] == 4
+
+        for _ in range(3):
+            await monitor.check_now()
+        assert monitor._interval["label"] == 8
+
+    @pytest.mark.asyncio
+    async def test_removed_printer_schedule_is_dropped(self):
+        """Printers gone from the registry should not keep a deadline."""
+        from src.health import HealthMonitor
+        from src.printers import PrinterRegistry
+        from src.printers.mock import MockLabelPrinter
+
+        registry = PrinterRegistry()
+        registry.register(MockLabelPrinter("label", "Label"))
+        registry.register(MockLabelPrinter("gone", "Gone"))
+
+        monitor = HealthMonitor(registry)
+        await monitor.check_now()
+        assert set(monitor._next_check_at) == {"label", "gone"}
+
+        # The registry has no unregister yet; simulate one
+        del registry._printers["gone"]
+        registry._version += 1
+        await monitor.check_now()
+
+        assert set(monitor._next_check_at) == {"label"}
+        assert set(monitor._interval) == {"label"}
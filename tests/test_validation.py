@@ -1,15 +1,18 @@
 """Tests for image and document validation."""
 
+import functools
+
 import pytest
 from io import BytesIO
 from PIL import Image
 
-from src.validation import validate_label_image, validate_pdf
+from src.validation import ValidationCache, validate_label_image, validate_pdf
 from src.validation.image import LabelImageConfig
 
 
-def create_test_image(width: int, height: int, mode: str = "1", color: int = 0) -> bytes:
-    """Create a test image and return as PNG bytes."""
+@functools.cache
+def create_test_image(width: int, height: int, mode: str = "1", color=0) -> bytes:
+    """Create a test image and return as PNG bytes (cached per arguments)."""
     img = Image.new(mode, (width, height), color)
     buffer = BytesIO()
     img.save(buffer, format="PNG")
@@ -34,10 +37,7 @@ class TestLabelImageValidation:
 
     def test_rgb_image_fails(self):
         """RGB image with colors should fail monochrome check."""
-        img = Image.new("RGB", (720, 100), (128, 128, 128))  # Gray
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        data = buffer.getvalue()
+        data = create_test_image(720, 100, mode="RGB", color=(128, 128, 128))  # Gray
 
         result = validate_label_image(data)
         assert not result.valid
@@ -45,13 +45,33 @@ class TestLabelImageValidation:
 
     def test_rgb_black_white_passes(self):
         """RGB image with only black and white should pass."""
-        img = Image.new("RGB", (720, 100), (0, 0, 0))  # Black
+        data = create_test_image(720, 100, mode="RGB", color=(0, 0, 0))  # Black
+
+        result = validate_label_image(data)
+        assert result.valid
+
+    def test_gray_pixel_reported(self):
+        """An out-of-band pixel value should be named in the error."""
+        img = Image.new("L", (720, 100), 255)
+        img.putpixel((0, 0), 0)
+        img.putpixel((300, 40), 128)
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
+
+        result = validate_label_image(buffer.getvalue())
+        assert not result.valid
+        assert result.error == "Image contains grayscale values (found 128)"
+
+    def test_monochrome_tolerance(self):
+        """Near-black and near-white pixels should pass within tolerance."""
+        img = Image.new("RGB", (720, 100), (250, 252, 255))
+        img.putpixel((0, 0), (3, 0, 5))
         buffer = BytesIO()
         img.save(buffer, format="PNG")
         data = buffer.getvalue()
 
-        result = validate_label_image(data)
-        assert result.valid
+        assert validate_label_image(data, LabelImageConfig(monochrome_tolerance=5)).valid
+        assert not validate_label_image(data, LabelImageConfig(monochrome_tolerance=4)).valid
 
     def test_invalid_format(self):
         """Non-PNG should fail."""
@@ -98,3 +118,45 @@ class TestPDFValidation:
         result = validate_pdf(b"")
         assert not result.valid
         assert result.error_code == "EMPTY_DATA"
+
+
+class TestValidationCache:
+    def test_repeated_data_validated_once(self):
+        """Identical payloads should reuse the first result."""
+        calls = []
+
+        def validator(data: bytes) -> str:
+            calls.append(data)
+            return f"result-{len(calls)}"
+
+        cache = ValidationCache()
+        assert cache.validate(validator, b"same") == "result-1"
+        assert cache.validate(validator, b"same") == "result-1"
+        assert cache.validate(validator, b"other") == "result-2"
+        assert len(calls) == 2
+
+    def test_results_are_per_validator(self):
+        """The same payload should be validated separately by each validator."""
+        cache = ValidationCache()
+        data = create_test_image(720, 100)
+
+        assert cache.validate(validate_label_image, data).valid
+        assert cache.validate(validate_pdf, data).error_code == "INVALID_FORMAT"
+
+    def test_oldest_entry_evicted(self):
+        """Cache should stay within maxsize, dropping least recently used."""
+        calls = []
+
+        def validator(data: bytes) -> bytes:
+            calls.append(data)
+            return data
+
+        cache = ValidationCache(maxsize=2)
+        cache.validate(validator, b"a")
+        cache.validate(validator, b"b")
+        cache.validate(validator, b"a")  # refresh "a"
+        cache.validate(validator, b"c")  # evicts "b"
+        cache.validate(validator, b"a")
+        cache.validate(validator, b"b")
+
+        assert calls == [b"a", b"b", b"c", b"b"]